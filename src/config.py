@@ -27,6 +27,17 @@ class ContactsConfig(BaseModel):
     default_max_results: int = Field(
         default=100, description="Default maximum number of results to return"
     )
+    api_num_retries: int = Field(
+        default=3,
+        description="Retries with exponential backoff for rate-limited or failed API requests",
+    )
+    cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="Seconds to reuse fetched contacts and contact group listings (0 disables)",
+    )
+    tool_timeout_seconds: float = Field(
+        default=60.0, description="Seconds a tool call may run before it is cancelled"
+    )
     scopes: List[str] = Field(
         default=[
             "https://www.googleapis.com/auth/contacts",
@@ -1,6 +1,86 @@
 """Formatting utilities for Google Contacts data display."""
 
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from sys import intern
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Shared layout fragments and section headers, interned once at import
+_SEP = intern("=" * 50)
+_BULLET = intern("   • ")
+_EMAIL_HDR = intern("📧 Email(s):")
+_PHONE_HDR = intern("📱 Phone(s):")
+_WORK_HDR = intern("🏢 Work:")
+_ADDR_HDR = intern("🏠 Address(es):")
+_URL_HDR = intern("🌐 Website(s):")
+_REL_HDR = intern("👥 Relations:")
+_EVENT_HDR = intern("📅 Events:")
+_CUSTOM_HDR = intern("🔧 Custom Fields:")
+_CUSTOM_DATA_HDR = intern("🔧 Custom Data:")
+_USER_GROUPS_HDR = intern("👤 USER CONTACT GROUPS:")
+_SYSTEM_GROUPS_HDR = intern("🔧 SYSTEM CONTACT GROUPS:")
+_PHOTO_LINE = intern("📷 Photo: Available")
+_MEMBERS_NONE = intern("👥 Members: None")
+
+# Zero-padded day and month numbers for date formatting
+_PAD2 = tuple(f"{i:02d}" for i in range(32))
+
+# Display labels for the People API contact group types
+_GROUP_TYPE_LABELS = {
+    "USER_CONTACT_GROUP": "User Contact Group",
+    "SYSTEM_CONTACT_GROUP": "System Contact Group",
+    "GROUP_TYPE_UNSPECIFIED": "Group Type Unspecified",
+}
+
+# Contact keys that produce output in format_contact
+_DISPLAYABLE_KEYS = frozenset(
+    (
+        "displayName",
+        "givenName",
+        "familyName",
+        "nickname",
+        "email",
+        "emails",
+        "phone",
+        "phones",
+        "organization",
+        "jobTitle",
+        "department",
+        "addresses",
+        "birthday",
+        "urls",
+        "notes",
+        "relations",
+        "events",
+        "customFields",
+        "groups",
+        "photoUrl",
+        "resourceName",
+    )
+)
+
+# Bulleted list sections: contact key -> (header, value field, label key, fallback label key)
+_LIST_SECTIONS = {
+    "emails": (_EMAIL_HDR, "value", "label", "type"),
+    "phones": (_PHONE_HDR, "value", "label", "type"),
+    "addresses": (_ADDR_HDR, "formatted", "type", "label"),
+    "urls": (_URL_HDR, "value", "type", "label"),
+    "relations": (_REL_HDR, "person", "type", "label"),
+}
+
+
+def _pick_label(
+    item: Dict[str, Any], primary: str = "label", fallback: str = "type", default: str = ""
+) -> str:
+    """Return the item's primary label key, falling back only when it is missing."""
+    label = item.get(primary)
+    if label is None:
+        label = item.get(fallback, default)
+    return label
+
+
+def _bullet(value: str, label: str = "") -> str:
+    """Format a bullet line, with the label in parentheses when there is one."""
+    return f"{_BULLET}{value} ({label})" if label else f"{_BULLET}{value}"
 
 
 def format_contact(contact: Dict[str, Any]) -> str:
@@ -15,266 +95,230 @@ def format_contact(contact: Dict[str, Any]) -> str:
     if not contact:
         return "No contact data available"
 
-    if "status" in contact and contact["status"] == "error":
+    if contact.get("status") == "error":
         return "Error: " + contact.get("message", "Unknown error")
 
-    parts = []
+    # Skip every section for contacts that carry nothing displayable
+    if _DISPLAYABLE_KEYS.isdisjoint(contact):
+        return "Contact has no details"
 
     # Format basic contact information
-    parts.extend(_format_contact_names(contact))
-    parts.extend(_format_contact_info(contact))
-    parts.extend(_format_professional_info(contact))
-    parts.extend(_format_address_info(contact))
-    parts.extend(_format_personal_info(contact))
-    parts.extend(_format_additional_info(contact))
+    # Sparse contacts skip the sections for fields they do not have
+    sections = _BASIC_CONTACT_SECTIONS if _RICH_KEYS.isdisjoint(contact) else _CONTACT_SECTIONS
+    formatted = "\n".join(
+        chain.from_iterable(format_section(contact) for format_section in sections)
+    )
 
-    return "\n".join(parts) if parts else "Contact has no details"
+    return formatted or "Contact has no details"
 
 
-def _format_contact_names(contact: Dict[str, Any]) -> List[str]:
+def _format_contact_names(contact: Dict[str, Any]) -> Iterator[str]:
     """Format name-related fields for a contact."""
-    parts = []
+    get = contact.get
 
     # Name information
-    if "displayName" in contact and contact["displayName"]:
-        parts.append("📝 Name: " + contact["displayName"])
-    elif "givenName" in contact or "familyName" in contact:
-        name_parts = []
-        if contact.get("givenName"):
-            name_parts.append(contact["givenName"])
-        if contact.get("familyName"):
-            name_parts.append(contact["familyName"])
-        if name_parts:
-            parts.append("📝 Name: " + " ".join(name_parts))
+    display_name = get("displayName")
+    if display_name:
+        yield "📝 Name: " + display_name
+    else:
+        given_name = get("givenName")
+        family_name = get("familyName")
+        if given_name and family_name:
+            yield "📝 Name: " + given_name + " " + family_name
+        elif given_name or family_name:
+            yield "📝 Name: " + (given_name or family_name)
 
     # Nickname
-    if contact.get("nickname"):
-        parts.append("🏷️  Nickname: " + contact["nickname"])
-
-    return parts
+    nickname = get("nickname")
+    if nickname:
+        yield "🏷️  Nickname: " + nickname
+
+
+def _format_list_section(contact: Dict[str, Any], key: str) -> Iterator[str]:
+    """Format a bulleted list section described by an entry of _LIST_SECTIONS."""
+    items = contact.get(key)
+    if not items:
+        return
+
+    header, value_field, primary, fallback = _LIST_SECTIONS[key]
+    yield header
+    for item in items:
+        if type(item) is dict:
+            yield _bullet(item.get(value_field, ""), _pick_label(item, primary, fallback))
+        else:
+            yield _bullet(item)
 
 
-def _format_contact_info(contact: Dict[str, Any]) -> List[str]:
+def _format_contact_info(contact: Dict[str, Any]) -> Iterator[str]:
     """Format contact information (emails, phones) for a contact."""
-    parts = []
-
     # Email addresses
-    if contact.get("emails"):
-        if isinstance(contact["emails"], list):
-            email_parts = []
-            for email in contact["emails"]:
-                if isinstance(email, dict):
-                    label = email.get("label", email.get("type", ""))
-                    label_text = " (" + label + ")" if label else ""
-                    email_parts.append("   • " + email.get("value", "") + label_text)
-                else:
-                    email_parts.append("   • " + email)
-            parts.append("📧 Email(s):\n" + "\n".join(email_parts))
-    elif contact.get("email"):
-        parts.append("📧 Email: " + contact["email"])
+    get = contact.get
+    email = get("email")
+    if get("emails"):
+        yield from _format_list_section(contact, "emails")
+    elif email:
+        yield "📧 Email: " + email
 
     # Phone numbers
-    if contact.get("phones"):
-        if isinstance(contact["phones"], list):
-            phone_parts = []
-            for phone in contact["phones"]:
-                if isinstance(phone, dict):
-                    label = phone.get("label", phone.get("type", ""))
-                    label_text = " (" + label + ")" if label else ""
-                    phone_parts.append("   • " + phone.get("value", "") + label_text)
-                else:
-                    phone_parts.append("   • " + phone)
-            parts.append("📱 Phone(s):\n" + "\n".join(phone_parts))
-    elif contact.get("phone"):
-        parts.append("📱 Phone: " + contact["phone"])
-
-    return parts
-
-
-def _format_professional_info(contact: Dict[str, Any]) -> List[str]:
-    """Format professional information for a contact."""
-    parts = []
+    phone = get("phone")
+    if get("phones"):
+        yield from _format_list_section(contact, "phones")
+    elif phone:
+        yield "📱 Phone: " + phone
 
-    # Professional information
-    if contact.get("organization") or contact.get("jobTitle") or contact.get("department"):
-        org_parts = []
-        if contact.get("organization"):
-            org_parts.append("Company: " + contact["organization"])
-        if contact.get("jobTitle"):
-            org_parts.append("Title: " + contact["jobTitle"])
-        if contact.get("department"):
-            org_parts.append("Department: " + contact["department"])
-        parts.append("🏢 Work:\n   • " + "\n   • ".join(org_parts))
 
-    return parts
+def _format_professional_info(contact: Dict[str, Any]) -> Iterator[str]:
+    """Format professional information for a contact."""
+    # Professional information
+    get = contact.get
+    organization = get("organization")
+    job_title = get("jobTitle")
+    department = get("department")
+    if organization or job_title or department:
+        yield _WORK_HDR
+        if organization:
+            yield _BULLET + "Company: " + organization
+        if job_title:
+            yield _BULLET + "Title: " + job_title
+        if department:
+            yield _BULLET + "Department: " + department
 
 
-def _format_address_info(contact: Dict[str, Any]) -> List[str]:
+def _format_address_info(contact: Dict[str, Any]) -> Iterator[str]:
     """Format address information for a contact."""
-    parts = []
+    yield from _format_list_section(contact, "addresses")
 
-    # Addresses
-    if contact.get("addresses"):
-        if isinstance(contact["addresses"], list):
-            addr_parts = []
-            for addr in contact["addresses"]:
-                if isinstance(addr, dict):
-                    formatted_addr = addr.get("formatted", "")
-                    addr_type = addr.get("type", addr.get("label", ""))
-                    type_text = " (" + addr_type + ")" if addr_type else ""
-                    addr_parts.append("   • " + formatted_addr + type_text)
-                else:
-                    addr_parts.append("   • " + addr)
-            parts.append("🏠 Address(es):\n" + "\n".join(addr_parts))
 
-    return parts
+def _fmt_date(date: Dict[str, Any]) -> str:
+    """Format a People API date dict as YYYY-MM-DD or MM-DD, or "" if incomplete."""
+    month = date.get("month")
+    day = date.get("day")
+    if not (month and day):
+        return ""
+    if 0 < month < 32 and 0 < day < 32:
+        month_day = _PAD2[month] + "-" + _PAD2[day]
+    else:
+        month_day = f"{month:02d}-{day:02d}"
+    year = date.get("year")
+    return f"{year}-{month_day}" if year else month_day
 
 
-def _format_personal_info(contact: Dict[str, Any]) -> List[str]:
+def _format_personal_info(contact: Dict[str, Any]) -> Iterator[str]:
     """Format personal information for a contact."""
-    parts = []
-
     # Birthday
-    if contact.get("birthday"):
-        birthday = contact["birthday"]
+    birthday = contact.get("birthday")
+    if birthday:
         if isinstance(birthday, dict):
-            year = birthday.get("year", "")
-            month = birthday.get("month", "")
-            day = birthday.get("day", "")
-            if year and month and day:
-                parts.append("🎂 Birthday: " + f"{year}-{month:02d}-{day:02d}")
-            elif month and day:
-                parts.append("🎂 Birthday: " + f"{month:02d}-{day:02d}")
+            date_str = _fmt_date(birthday)
+            if date_str:
+                yield "🎂 Birthday: " + date_str
         else:
-            parts.append("🎂 Birthday: " + birthday)
+            yield "🎂 Birthday: " + birthday
 
     # Websites/URLs
-    if contact.get("urls"):
-        if isinstance(contact["urls"], list):
-            url_parts = []
-            for url in contact["urls"]:
-                if isinstance(url, dict):
-                    url_value = url.get("value", "")
-                    url_type = url.get("type", url.get("label", ""))
-                    type_text = " (" + url_type + ")" if url_type else ""
-                    url_parts.append("   • " + url_value + type_text)
-                else:
-                    url_parts.append("   • " + url)
-            parts.append("🌐 Website(s):\n" + "\n".join(url_parts))
+    yield from _format_list_section(contact, "urls")
 
     # Notes/Biography
-    if contact.get("notes"):
-        notes = contact["notes"]
+    notes = contact.get("notes")
+    if notes:
         # Truncate very long notes
-        if len(notes) > 200:
-            notes = notes[:200] + "..."
-        parts.append("📝 Notes: " + notes)
-
-    return parts
+        yield "📝 Notes: " + (notes[:200] + "..." if len(notes) > 200 else notes)
 
 
-def _format_additional_info(contact: Dict[str, Any]) -> List[str]:
-    """Format additional information for a contact."""
-    parts = []
+def _format_relations_info(contact: Dict[str, Any]) -> Iterator[str]:
+    """Format relations information for a contact."""
+    yield from _format_list_section(contact, "relations")
 
-    # Format different sections
-    parts.extend(_format_relations_info(contact))
-    parts.extend(_format_events_info(contact))
-    parts.extend(_format_custom_fields_info(contact))
-    parts.extend(_format_metadata_info(contact))
 
-    return parts
+def _format_events_info(contact: Dict[str, Any]) -> Iterator[str]:
+    """Format events information for a contact."""
+    events = contact.get("events")
+    if not events:
+        return
+
+    event_parts = []
+    for event in events:
+        if type(event) is dict:
+            event_type = _pick_label(event, "type", "label", "Event")
+            event_date = event.get("date", {})
+            if isinstance(event_date, dict):
+                date_str = _fmt_date(event_date)
+                if date_str:
+                    event_parts.append(f"{_BULLET}{event_type}: {date_str}")
+            else:
+                event_parts.append(f"{_BULLET}{event_type}: {event_date}")
+        else:
+            event_parts.append(_bullet(event))
+    if event_parts:
+        yield _EVENT_HDR
+        yield from event_parts
 
 
-def _format_relations_info(contact: Dict[str, Any]) -> List[str]:
-    """Format relations information for a contact."""
-    parts = []
-    if contact.get("relations"):
-        if isinstance(contact["relations"], list):
-            rel_parts = []
-            for relation in contact["relations"]:
-                if isinstance(relation, dict):
-                    person = relation.get("person", "")
-                    rel_type = relation.get("type", relation.get("label", ""))
-                    type_text = " (" + rel_type + ")" if rel_type else ""
-                    rel_parts.append("   • " + person + type_text)
-                else:
-                    rel_parts.append("   • " + relation)
-            parts.append("👥 Relations:\n" + "\n".join(rel_parts))
-    return parts
-
-
-def _format_events_info(contact: Dict[str, Any]) -> List[str]:
-    """Format events information for a contact."""
-    parts = []
-    if contact.get("events"):
-        if isinstance(contact["events"], list):
-            event_parts = []
-            for event in contact["events"]:
-                if isinstance(event, dict):
-                    event_type = event.get("type", event.get("label", "Event"))
-                    event_date = event.get("date", {})
-                    if isinstance(event_date, dict):
-                        month = event_date.get("month", "")
-                        day = event_date.get("day", "")
-                        year = event_date.get("year", "")
-                        if month and day:
-                            date_str = f"{month:02d}-{day:02d}"
-                            if year:
-                                date_str = f"{year}-{date_str}"
-                            event_parts.append("   • " + event_type + ": " + date_str)
-                    else:
-                        event_parts.append("   • " + event_type + ": " + event_date)
-                else:
-                    event_parts.append("   • " + event)
-            if event_parts:
-                parts.append("📅 Events:\n" + "\n".join(event_parts))
-    return parts
-
-
-def _format_custom_fields_info(contact: Dict[str, Any]) -> List[str]:
+def _format_custom_fields_info(contact: Dict[str, Any]) -> Iterator[str]:
     """Format custom fields information for a contact."""
-    parts = []
-    if contact.get("customFields"):
-        if isinstance(contact["customFields"], list):
-            custom_parts = []
-            for field in contact["customFields"]:
-                if isinstance(field, dict):
-                    key = field.get("key", "")
-                    value = field.get("value", "")
-                    if key and value:
-                        custom_parts.append("   • " + key + ": " + value)
-            if custom_parts:
-                parts.append("🔧 Custom Fields:\n" + "\n".join(custom_parts))
-    return parts
-
-
-def _format_metadata_info(contact: Dict[str, Any]) -> List[str]:
-    """Format metadata information for a contact."""
-    parts = []
+    custom_fields = contact.get("customFields")
+    if not custom_fields:
+        return
+
+    custom_parts = []
+    for field in custom_fields:
+        if type(field) is dict:
+            key = field.get("key", "")
+            value = field.get("value", "")
+            if key and value:
+                custom_parts.append(f"{_BULLET}{key}: {value}")
+    if custom_parts:
+        yield _CUSTOM_HDR
+        yield from custom_parts
+
 
+def _format_metadata_info(contact: Dict[str, Any]) -> Iterator[str]:
+    """Format metadata information for a contact."""
     # Contact groups
-    if contact.get("groups"):
-        group_count = len(contact["groups"])
-        if group_count > 0:
-            parts.append("📂 Groups: " + str(group_count) + " group(s)")
+    groups = contact.get("groups")
+    if groups:
+        yield "📂 Groups: " + str(len(groups)) + " group(s)"
 
     # Photo
     if contact.get("photoUrl"):
-        parts.append("📷 Photo: Available")
+        yield _PHOTO_LINE
 
     # Resource ID for reference
-    if contact.get("resourceName"):
-        parts.append("🔗 ID: " + contact["resourceName"])
-
-    return parts
-
-
-def format_contacts_list(contacts: List[Dict[str, Any]]) -> str:
+    resource_name = contact.get("resourceName")
+    if resource_name:
+        yield "🔗 ID: " + resource_name
+
+
+# Section formatters in the order their lines appear in format_contact
+_CONTACT_SECTIONS = (
+    _format_contact_names,
+    _format_contact_info,
+    _format_professional_info,
+    _format_address_info,
+    _format_personal_info,
+    _format_relations_info,
+    _format_events_info,
+    _format_custom_fields_info,
+    _format_metadata_info,
+)
+
+# Fields rendered only by the sections that _BASIC_CONTACT_SECTIONS leaves out
+_RICH_KEYS = frozenset(
+    ("addresses", "birthday", "urls", "notes", "relations", "events", "customFields")
+)
+_BASIC_CONTACT_SECTIONS = (
+    _format_contact_names,
+    _format_contact_info,
+    _format_professional_info,
+    _format_metadata_info,
+)
+
+
+def format_contacts_list(contacts: Iterable[Dict[str, Any]]) -> str:
     """Format a list of contacts into a readable string with enhanced display.
 
     Args:
-        contacts: List of contact dictionaries
+        contacts: List or iterator of contact dictionaries
 
     Returns:
         Formatted string representation of the contacts list
@@ -282,97 +326,91 @@ def format_contacts_list(contacts: List[Dict[str, Any]]) -> str:
     if not contacts:
         return "No contacts found."
 
-    if isinstance(contacts, dict) and "status" in contacts and contacts["status"] == "error":
-        return "Error: " + contacts.get("message", "Unknown error")
-
-    parts = []
-
-    for i, contact in enumerate(contacts, 1):
-        # Create a compact summary for lists
-        contact_summary = _format_contact_summary(contact, i)
-        parts.append(contact_summary)
-        parts.append("")  # Add blank line between contacts
+    # Build the compact summaries and tally the statistics in the same pass
+    lines = []
+    count = with_email = with_phone = with_org = with_addr = 0
+    for count, contact in enumerate(contacts, 1):
+        _write_contact_summary(contact, count, lines)
+        lines.append("")
+        get = contact.get
+        if get("emails") or get("email"):
+            with_email += 1
+        if get("phones") or get("phone"):
+            with_phone += 1
+        if get("organization"):
+            with_org += 1
+        if get("addresses"):
+            with_addr += 1
+
+    # An iterator is only known to be empty once consumed
+    if not count:
+        return "No contacts found."
 
-    summary = "📊 Found " + str(len(contacts)) + " contact(s)"
+    summary = "📊 Found " + str(count) + " contact(s)"
 
     # Add statistics
-    stats = _calculate_contact_stats(contacts)
+    stats = _format_contact_stats(with_email, with_phone, with_org, with_addr)
     if stats:
         summary += "\n📈 Statistics: " + stats
 
-    parts.append("=" * 50)
-    parts.append(summary)
+    lines.append(_SEP)
+    lines.append(summary)
+    return "\n".join(lines)
 
-    return "\n".join(parts)
+
+def _primary_value(person: Dict[str, Any], list_key: str, scalar_key: str) -> Optional[str]:
+    """Return the first value of a person's list field, else its single-value field."""
+    items = person.get(list_key)
+    if items:
+        primary = items[0]
+        return primary.get("value", "") if type(primary) is dict else None
+    return person.get(scalar_key) or None
 
 
-def _format_contact_summary(contact: Dict[str, Any], index: int) -> str:
-    """Format a single contact as a summary for list display."""
-    summary_parts = ["Contact " + str(index) + ":"]
+def _write_contact_summary(contact: Dict[str, Any], index: int, out: List[str]) -> None:
+    """Append a single contact's summary lines for list display to out."""
+    out.append("Contact " + str(index) + ":")
+
+    get = contact.get
 
     # Name
-    name = (
-        contact.get("displayName")
-        or f"{contact.get('givenName', '')} {contact.get('familyName', '')}".strip()
-    )
+    name = get("displayName")
+    if not name:
+        given_name = get("givenName", "")
+        family_name = get("familyName", "")
+        if given_name or family_name:
+            name = f"{given_name} {family_name}".strip()
     if name:
-        summary_parts.append("  📝 " + name)
+        out.append("  📝 " + name)
 
     # Primary email
-    if contact.get("emails") and isinstance(contact["emails"], list):
-        primary_email = contact["emails"][0]
-        if isinstance(primary_email, dict):
-            summary_parts.append("  📧 " + primary_email.get("value", ""))
-    elif contact.get("email"):
-        summary_parts.append("  📧 " + contact["email"])
+    email = _primary_value(contact, "emails", "email")
+    if email is not None:
+        out.append("  📧 " + email)
 
     # Primary phone
-    if contact.get("phones") and isinstance(contact["phones"], list):
-        primary_phone = contact["phones"][0]
-        if isinstance(primary_phone, dict):
-            summary_parts.append("  📱 " + primary_phone.get("value", ""))
-    elif contact.get("phone"):
-        summary_parts.append("  📱 " + contact["phone"])
+    phone = _primary_value(contact, "phones", "phone")
+    if phone is not None:
+        out.append("  📱 " + phone)
 
     # Organization
-    if contact.get("organization"):
-        job_title = contact.get("jobTitle", "")
-        org_text = contact["organization"]
+    organization = get("organization")
+    if organization:
+        job_title = get("jobTitle")
         if job_title:
-            org_text += " - " + job_title
-        summary_parts.append("  🏢 " + org_text)
+            organization += " - " + job_title
+        out.append("  🏢 " + organization)
 
-    return "\n".join(summary_parts)
-
-
-def _calculate_contact_stats(contacts: List[Dict[str, Any]]) -> str:
-    """Calculate and return statistics about the contacts list."""
-    if not contacts:
-        return ""
 
+def _format_contact_stats(with_email: int, with_phone: int, with_org: int, with_addr: int) -> str:
+    """Format the contact list statistics, omitting any that are zero."""
     stats = []
-
-    # Count contacts with emails
-    with_email = sum(
-        1 for c in contacts if c.get("email") or (c.get("emails") and len(c["emails"]) > 0)
-    )
     if with_email > 0:
         stats.append(str(with_email) + " with email")
-
-    # Count contacts with phones
-    with_phone = sum(
-        1 for c in contacts if c.get("phone") or (c.get("phones") and len(c["phones"]) > 0)
-    )
     if with_phone > 0:
         stats.append(str(with_phone) + " with phone")
-
-    # Count contacts with organizations
-    with_org = sum(1 for c in contacts if c.get("organization"))
     if with_org > 0:
         stats.append(str(with_org) + " with organization")
-
-    # Count contacts with addresses
-    with_addr = sum(1 for c in contacts if c.get("addresses") and len(c["addresses"]) > 0)
     if with_addr > 0:
         stats.append(str(with_addr) + " with addresses")
 
@@ -397,11 +435,11 @@ def format_directory_people(people: List[Dict[str, Any]], query: Optional[str] =
     # Count how many users have emails
     users_with_email = _count_users_with_email(people)
 
-    # Format the results
-    formatted_users = []
+    # Format the results, each member followed by a blank line
+    lines = []
     for i, user in enumerate(people, 1):
-        user_parts = _format_single_directory_user(user, i)
-        formatted_users.append("\n".join(user_parts))
+        _write_directory_user(user, i, lines)
+        lines.append("")
 
     # Add summary
     query_part = " matching '" + query + "'" if query else ""
@@ -414,59 +452,57 @@ def format_directory_people(people: List[Dict[str, Any]], query: Optional[str] =
         + str(users_with_email)
         + " have email addresses."
     )
-    formatted_users.append("=" * 50)
-    formatted_users.append(summary)
-
-    return "\n\n".join(formatted_users)
+    lines.append(_SEP)
+    lines.append("")
+    lines.append(summary)
+    return "\n".join(lines)
 
 
 def _count_users_with_email(people: List[Dict[str, Any]]) -> int:
     """Count how many users in the list have email addresses."""
-    return sum(
-        1
-        for user in people
-        if user.get("email") or (user.get("emails") and len(user["emails"]) > 0)
-    )
+    count = 0
+    for user in people:
+        get = user.get
+        if get("emails") or get("email"):
+            count += 1
+    return count
 
 
-def _format_single_directory_user(user: Dict[str, Any], index: int) -> List[str]:
-    """Format a single directory user's information."""
-    user_parts = []
-    user_parts.append("📁 Directory Member " + str(index) + ":")
+def _write_directory_user(user: Dict[str, Any], index: int, out: List[str]) -> None:
+    """Append a single directory user's information lines to out."""
+    get = user.get
+    out.append("📁 Directory Member " + str(index) + ":")
 
     # Name
-    if user.get("displayName"):
-        user_parts.append("  📝 Name: " + user["displayName"])
+    display_name = get("displayName")
+    if display_name:
+        out.append("  📝 Name: " + display_name)
 
     # Email
-    if user.get("emails") and isinstance(user["emails"], list):
-        primary_email = user["emails"][0]
-        if isinstance(primary_email, dict):
-            user_parts.append("  📧 Email: " + primary_email.get("value", ""))
-    elif user.get("email"):
-        user_parts.append("  📧 Email: " + user["email"])
+    email = _primary_value(user, "emails", "email")
+    if email is not None:
+        out.append("  📧 Email: " + email)
 
     # Organization info
-    if user.get("organization"):
-        user_parts.append("  🏢 Organization: " + user["organization"])
-    if user.get("department"):
-        user_parts.append("  🏛️  Department: " + user["department"])
-    if user.get("jobTitle"):
-        user_parts.append("  💼 Title: " + user["jobTitle"])
+    organization = get("organization")
+    if organization:
+        out.append("  🏢 Organization: " + organization)
+    department = get("department")
+    if department:
+        out.append("  🏛️  Department: " + department)
+    job_title = get("jobTitle")
+    if job_title:
+        out.append("  💼 Title: " + job_title)
 
     # Phone
-    if user.get("phones") and isinstance(user["phones"], list):
-        primary_phone = user["phones"][0]
-        if isinstance(primary_phone, dict):
-            user_parts.append("  📱 Phone: " + primary_phone.get("value", ""))
-    elif user.get("phone"):
-        user_parts.append("  📱 Phone: " + user["phone"])
+    phone = _primary_value(user, "phones", "phone")
+    if phone is not None:
+        out.append("  📱 Phone: " + phone)
 
     # Resource ID
-    if user.get("resourceName"):
-        user_parts.append("  🔗 ID: " + user["resourceName"])
-
-    return user_parts
+    resource_name = get("resourceName")
+    if resource_name:
+        out.append("  🔗 ID: " + resource_name)
 
 
 def format_contact_group(group: Dict[str, Any]) -> str:
@@ -485,51 +521,51 @@ def format_contact_group(group: Dict[str, Any]) -> str:
 
     # Group name and type
     name = group.get("name", "Unnamed Group")
-    group_type = group.get("groupType", "").replace("_", " ").title()
+    group_type = group.get("groupType", "")
+    group_type = _GROUP_TYPE_LABELS.get(group_type) or group_type.replace("_", " ").title()
     if group_type:
         parts.append("📂 " + name + " (" + group_type + ")")
     else:
         parts.append("📂 " + name)
 
     # Member count
-    member_count = group.get("memberCount", 0)
+    member_count = group.get("memberCount") or 0
     if member_count > 0:
         parts.append("👥 Members: " + str(member_count))
     else:
-        parts.append("👥 Members: None")
+        parts.append(_MEMBERS_NONE)
 
     # Update time
-    if group.get("updateTime"):
-        parts.append("🕒 Last Updated: " + group["updateTime"])
+    update_time = group.get("updateTime")
+    if update_time:
+        parts.append("🕒 Last Updated: " + update_time)
 
     # Resource ID
-    if group.get("resourceName"):
-        parts.append("🔗 ID: " + group["resourceName"])
+    resource_name = group.get("resourceName")
+    if resource_name:
+        parts.append("🔗 ID: " + resource_name)
 
     # Client data
-    if group.get("clientData"):
+    client_data = group.get("clientData")
+    if client_data:
         client_data_parts = []
-        for data in group["clientData"]:
+        for data in client_data:
             key = data.get("key", "")
             value = data.get("value", "")
             if key and value:
-                client_data_parts.append("   • " + key + ": " + value)
+                client_data_parts.append(f"{_BULLET}{key}: {value}")
         if client_data_parts:
-            parts.append("🔧 Custom Data:\n" + "\n".join(client_data_parts))
+            parts.append(_CUSTOM_DATA_HDR)
+            parts.extend(client_data_parts)
 
     # Member resource names (if included)
-    if group.get("memberResourceNames"):
-        member_names = group["memberResourceNames"]
-        if len(member_names) <= 5:
+    member_names = group.get("memberResourceNames")
+    if member_names:
+        extra = len(member_names) - 5
+        if extra <= 0:
             parts.append("📋 Member IDs: " + ", ".join(member_names))
         else:
-            parts.append(
-                "📋 Member IDs: "
-                + ", ".join(member_names[:5])
-                + " ... (and "
-                + str(len(member_names) - 5)
-                + " more)"
-            )
+            parts.append(f"📋 Member IDs: {', '.join(member_names[:5])} ... (and {extra} more)")
 
     return "\n".join(parts)
 
@@ -548,12 +584,20 @@ def format_contact_groups_list(groups: List[Dict[str, Any]]) -> str:
 
     parts = []
 
-    # Separate user and system groups
-    user_groups = [g for g in groups if g.get("groupType") == "USER_CONTACT_GROUP"]
-    system_groups = [g for g in groups if g.get("groupType") == "SYSTEM_CONTACT_GROUP"]
+    # Separate user and system groups and total their members in a single pass
+    user_groups = []
+    system_groups = []
+    total_members = 0
+    for group in groups:
+        group_type = group.get("groupType")
+        if group_type == "USER_CONTACT_GROUP":
+            user_groups.append(group)
+        elif group_type == "SYSTEM_CONTACT_GROUP":
+            system_groups.append(group)
+        total_members += group.get("memberCount") or 0
 
     if user_groups:
-        parts.append("👤 USER CONTACT GROUPS:")
+        parts.append(_USER_GROUPS_HDR)
         parts.append("")
         for i, group in enumerate(user_groups, 1):
             group_summary = _format_contact_group_summary(group, i)
@@ -561,7 +605,7 @@ def format_contact_groups_list(groups: List[Dict[str, Any]]) -> str:
             parts.append("")
 
     if system_groups:
-        parts.append("🔧 SYSTEM CONTACT GROUPS:")
+        parts.append(_SYSTEM_GROUPS_HDR)
         parts.append("")
         for i, group in enumerate(system_groups, 1):
             group_summary = _format_contact_group_summary(group, i, is_system=True)
@@ -569,8 +613,7 @@ def format_contact_groups_list(groups: List[Dict[str, Any]]) -> str:
             parts.append("")
 
     # Summary statistics
-    total_members = sum(group.get("memberCount", 0) for group in groups)
-    parts.append("=" * 50)
+    parts.append(_SEP)
     parts.append(
         "📊 Summary: "
         + str(len(groups))
@@ -590,17 +633,17 @@ def _format_contact_group_summary(
 ) -> str:
     """Format a single contact group as a summary for list display."""
     icon = "🔧" if is_system else "📂"
-    summary_parts = [icon + " Group " + str(index) + ": " + group.get("name", "Unnamed")]
-
-    # Member count
-    member_count = group.get("memberCount", 0)
-    summary_parts.append("  👥 " + str(member_count) + " member(s)")
+    summary = (
+        f"{icon} Group {index}: {group.get('name', 'Unnamed')}\n"
+        f"  👥 {group.get('memberCount') or 0} member(s)"
+    )
 
     # Resource name
-    if group.get("resourceName"):
-        summary_parts.append("  🔗 " + group["resourceName"])
+    resource_name = group.get("resourceName")
+    if resource_name:
+        summary += "\n  🔗 " + resource_name
 
-    return "\n".join(summary_parts)
+    return summary
 
 
 def format_group_membership_result(result: Dict[str, Any], operation: str = "modify") -> str:
@@ -632,8 +675,7 @@ def format_group_membership_result(result: Dict[str, Any], operation: str = "mod
     if result.get("not_found"):
         not_found = result["not_found"]
         parts.append("⚠️  " + str(len(not_found)) + " contact(s) not found:")
-        for contact in not_found:
-            parts.append("   • " + contact)
+        parts.extend(map(_bullet, not_found))
 
     # Handle contacts that couldn't be modified
     if result.get("could_not_add"):
@@ -643,7 +685,6 @@ def format_group_membership_result(result: Dict[str, Any], operation: str = "mod
         parts.append(
             "⚠️  Could not remove " + str(len(could_not_remove)) + " contact(s) (last group):"
         )
-        for contact in could_not_remove:
-            parts.append("   • " + contact)
+        parts.extend(map(_bullet, could_not_remove))
 
     return "\n".join(parts)
@@ -1,18 +1,30 @@
 """Google Contacts service implementation for MCP server."""
 
 import json
+import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from google.auth.exceptions import GoogleAuthError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from httplib2 import HttpLib2Error
 
 from config import config
 
+logger = logging.getLogger(__name__)
+
+# Failures of an API call: HTTP errors, credential refresh errors and transport errors
+API_ERRORS = (HttpError, GoogleAuthError, HttpLib2Error, OSError)
+
 
 class GoogleContactsError(Exception):
     """Exception raised for errors in the Google Contacts service."""
@@ -24,7 +36,7 @@ class GoogleContactsService:
     """Service to interact with Google Contacts API."""
 
     # Extended person fields for comprehensive contact information
-    PERSON_FIELDS = [
+    PERSON_FIELDS = (
         "names",
         "emailAddresses",
         "phoneNumbers",
@@ -50,7 +62,85 @@ class GoogleContactsService:
         "coverPhotos",
         "locales",
         "externalIds",
-    ]
+    )
+
+    # personFields/readMask values, joined once rather than on every request
+    ALL_FIELDS_MASK = ",".join(PERSON_FIELDS)
+    LIST_FIELDS_MASK = (
+        "names,emailAddresses,phoneNumbers,addresses,organizations,"
+        "birthdays,urls,biographies,relations,nicknames"
+    )
+    BASIC_FIELDS_MASK = "names,emailAddresses,phoneNumbers,addresses,organizations"
+    DIRECTORY_FIELDS_MASK = "names,emailAddresses,organizations,phoneNumbers"
+
+    # Input field -> People API person field, for update_contact's updatePersonFields
+    UPDATE_FIELD_MAPPING = {
+        "given_name": "names",
+        "family_name": "names",
+        "nickname": "nicknames",
+        "email": "emailAddresses",
+        "emails": "emailAddresses",
+        "phone": "phoneNumbers",
+        "phones": "phoneNumbers",
+        "address": "addresses",
+        "addresses": "addresses",
+        "organization": "organizations",
+        "job_title": "organizations",
+        "birthday": "birthdays",
+        "website": "urls",
+        "urls": "urls",
+        "notes": "biographies",
+        "relations": "relations",
+        "events": "events",
+        "custom_fields": "userDefined",
+    }
+
+    # Update keys that are merged into the contact's existing entries rather than replacing them
+    MERGED_UPDATE_KEYS = frozenset(
+        {"given_name", "family_name", "email", "phone", "organization", "job_title"}
+    )
+
+    # People API limits on the number of contacts per batch request
+    BATCH_CREATE_LIMIT = 200
+    BATCH_DELETE_LIMIT = 500
+    GROUP_MODIFY_LIMIT = 1000
+    BATCH_GET_LIMIT = 200
+
+    # Maximum number of cached lookups kept before the cache is reset
+    CACHE_MAX_SIZE = 2048
+
+    # Partial response mask limited to what _format_contact_group reads
+    GROUP_LIST_FIELDS = (
+        "contactGroups(resourceName,etag,name,formattedName,groupType,memberCount,"
+        "metadata/updateTime,metadata/deleted,clientData),nextPageToken"
+    )
+
+    # (output key, People API key) pairs used to translate person entries into contact fields
+    NAME_SPEC = (
+        ("givenName", "givenName"),
+        ("familyName", "familyName"),
+        ("displayName", "displayName"),
+        ("middleName", "middleName"),
+        ("honorificPrefix", "honorificPrefix"),
+        ("honorificSuffix", "honorificSuffix"),
+    )
+    TYPED_VALUE_SPEC = (("value", "value"), ("type", "type"), ("label", "formattedType"))
+    ADDRESS_SPEC = (
+        ("formatted", "formattedValue"),
+        ("type", "type"),
+        ("street", "streetAddress"),
+        ("city", "city"),
+        ("region", "region"),
+        ("postal_code", "postalCode"),
+        ("country", "country"),
+    )
+    ORGANIZATION_SPEC = (
+        ("organization", "name"),
+        ("jobTitle", "title"),
+        ("department", "department"),
+    )
+    RELATION_SPEC = (("person", "person"), ("type", "type"), ("label", "formattedType"))
+    CUSTOM_FIELD_SPEC = (("key", "key"), ("value", "value"))
 
     def __init__(
         self, credentials_info: Optional[Dict[str, Any]] = None, token_path: Optional[Path] = None
@@ -63,7 +153,82 @@ class GoogleContactsService:
         """
         self.credentials_info = credentials_info
         self.token_path = token_path or config.token_path
-        self.service = self._authenticate()
+        self.credentials = self._authenticate()
+        self._local = threading.local()
+        # Worker threads for fetching contact pages ahead of the consumer; each keeps its own client
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="contacts-prefetch"
+        )
+        # Latest known etag per contact group resource name, refreshed by every group response
+        self._group_etags: Dict[str, str] = {}
+        # Short-lived lookup caches: key -> (expiry time, result)
+        self._contact_cache: Dict[Tuple[str, bool], Tuple[float, Dict[str, Any]]] = {}
+        self._group_list_cache: Dict[bool, Tuple[float, List[Dict[str, Any]]]] = {}
+
+    @property
+    def service(self):
+        """People API client for the calling thread, built on first use.
+
+        httplib2 connections are not thread-safe, so each thread gets its own client sharing
+        the same credentials.
+        """
+        service = getattr(self._local, "service", None)
+        if service is None:
+            # Use the discovery document bundled with the client library, skipping the
+            # discovery cache lookup and network fetch
+            service = build(
+                "people",
+                "v1",
+                credentials=self.credentials,
+                cache_discovery=False,
+                static_discovery=True,
+            )
+            self._local.service = service
+        return service
+
+    @staticmethod
+    def _cache_get(cache: Dict[Any, Tuple[float, Any]], key: Any) -> Any:
+        """Return a cached value that has not expired yet, or None."""
+        entry = cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def _cache_put(self, cache: Dict[Any, Tuple[float, Any]], key: Any, value: Any) -> None:
+        """Cache a value for config.cache_ttl_seconds."""
+        if config.cache_ttl_seconds <= 0:
+            return
+        if len(cache) >= self.CACHE_MAX_SIZE:
+            cache.clear()
+        cache[key] = (time.monotonic() + config.cache_ttl_seconds, value)
+
+    def _invalidate_contact(self, resource_name: str) -> None:
+        """Drop every cached variant of a contact."""
+        self._contact_cache.pop((resource_name, True), None)
+        self._contact_cache.pop((resource_name, False), None)
+
+    def _thread_resource(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Return a People API resource handle cached for the calling thread."""
+        resource = getattr(self._local, name, None)
+        if resource is None:
+            resource = factory()
+            setattr(self._local, name, resource)
+        return resource
+
+    @property
+    def _people(self):
+        """Cached people() resource for the calling thread."""
+        return self._thread_resource("people", lambda: self.service.people())
+
+    @property
+    def _contact_groups(self):
+        """Cached contactGroups() resource for the calling thread."""
+        return self._thread_resource("contact_groups", lambda: self.service.contactGroups())
+
+    @property
+    def _group_members(self):
+        """Cached contactGroups().members() resource for the calling thread."""
+        return self._thread_resource("group_members", lambda: self._contact_groups.members())
 
     @classmethod
     def from_file(
@@ -132,7 +297,7 @@ class GoogleContactsService:
         """Authenticate with Google using credentials info.
 
         Returns:
-            Authenticated Google service client
+            Valid OAuth credentials
 
         Raises:
             GoogleContactsError: If authentication fails
@@ -141,15 +306,11 @@ class GoogleContactsService:
             creds = None
             token_path = self.token_path
 
-            # Ensure token directory exists
-            token_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Check if we have existing token
             if token_path.exists():
-                with open(token_path, "r") as token_file:
-                    creds = Credentials.from_authorized_user_info(
-                        json.load(token_file), config.scopes
-                    )
+                creds = Credentials.from_authorized_user_info(
+                    json.loads(token_path.read_text()), config.scopes
+                )
 
             # Check for refresh token in environment
             refresh_token = os.environ.get("GOOGLE_REFRESH_TOKEN") or config.google_refresh_token
@@ -180,8 +341,8 @@ class GoogleContactsService:
                     creds = flow.run_local_server(port=0)
 
                 # Save the credentials for future use
-                with open(token_path, "w") as token:
-                    token.write(creds.to_json())
+                token_path.parent.mkdir(parents=True, exist_ok=True)
+                token_path.write_text(creds.to_json())
 
                 # Output refresh token for environment variable setup
                 if creds.refresh_token:
@@ -190,8 +351,7 @@ class GoogleContactsService:
                     )
                     print(f"GOOGLE_REFRESH_TOKEN={creds.refresh_token}\n")
 
-            # Build and return the Google Contacts service
-            return build("people", "v1", credentials=creds)
+            return creds
 
         except Exception as e:
             raise GoogleContactsError(f"Authentication failed: {str(e)}")
@@ -215,63 +375,108 @@ class GoogleContactsService:
         Raises:
             GoogleContactsError: If API request fails
         """
-        max_results = max_results or config.default_max_results
+        return list(self.stream_contacts(name_filter, max_results, include_all_fields))
 
-        try:
-            contacts = []
-            next_page_token = None
+    def stream_contacts(
+        self,
+        name_filter: Optional[str] = None,
+        max_results: int = None,
+        include_all_fields: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over up to max_results contacts, optionally filtering by name.
 
-            # Use extended fields if requested
-            person_fields = (
-                ",".join(self.PERSON_FIELDS)
-                if include_all_fields
-                else "names,emailAddresses,phoneNumbers,addresses,organizations,birthdays,urls,biographies,relations,nicknames"
-            )
+        Args:
+            name_filter: Optional filter to find contacts by name
+            max_results: Maximum number of results to return
+            include_all_fields: Whether to include all contact fields
 
-            while len(contacts) < max_results:
-                page_size = min(1000, max_results - len(contacts))  # Google API limit is 1000
+        Returns:
+            Iterator of contact dictionaries
 
-                request_params = {
-                    "resourceName": "people/me",
-                    "pageSize": page_size,
-                    "personFields": person_fields,
-                    "sortOrder": "DISPLAY_NAME_ASCENDING",
-                }
+        Raises:
+            GoogleContactsError: If API request fails
+        """
+        max_results = max_results or config.default_max_results
 
-                if next_page_token:
-                    request_params["pageToken"] = next_page_token
+        # A name filter discards rows, so fetch full pages rather than just what is still needed
+        page_size = 1000 if name_filter else max_results
+        return self.iter_contacts(name_filter, include_all_fields, page_size, limit=max_results)
 
-                results = self.service.people().connections().list(**request_params).execute()
+    def iter_contacts(
+        self,
+        name_filter: Optional[str] = None,
+        include_all_fields: bool = False,
+        page_size: int = 1000,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over contacts, fetching the next page in the background while one is consumed.
 
-                connections = results.get("connections", [])
-                if not connections:
-                    break
+        Args:
+            name_filter: Optional filter to find contacts by name
+            include_all_fields: Whether to include all contact fields
+            page_size: Number of contacts to request per page (capped at the API limit of 1000)
+            limit: Optional maximum number of contacts to yield; no page is fetched beyond it
 
-                for person in connections:
-                    contact = self._format_contact_enhanced(person)
+        Yields:
+            Contact dictionaries
 
-                    # Apply name filter if provided
-                    if name_filter:
-                        filter_lower = name_filter.lower()
-                        if not any(
-                            filter_lower in str(contact.get(field, "")).lower()
-                            for field in ["displayName", "givenName", "familyName", "nickname"]
-                        ):
-                            continue
+        Raises:
+            GoogleContactsError: If API request fails
+        """
+        request_params = {
+            "resourceName": "people/me",
+            "pageSize": min(page_size, 1000),
+            "personFields": self.ALL_FIELDS_MASK if include_all_fields else self.LIST_FIELDS_MASK,
+            "sortOrder": "DISPLAY_NAME_ASCENDING",
+        }
+        filter_lower = name_filter.lower() if name_filter else None
+        remaining = limit
+        next_page = None
 
-                    contacts.append(contact)
+        try:
+            results = self._list_connections_page(request_params)
+            while True:
+                connections = results.get("connections", [])
+                if not connections:
+                    return
 
-                    if len(contacts) >= max_results:
-                        break
+                # Apply name filter on the raw people before formatting them
+                if filter_lower:
+                    connections = [p for p in connections if self._name_matches(p, filter_lower)]
+                if remaining is not None:
+                    connections = connections[:remaining]
+                    remaining -= len(connections)
 
+                # Request the following page while this one is formatted, if more rows are needed
                 next_page_token = results.get("nextPageToken")
-                if not next_page_token:
-                    break
+                if next_page_token and remaining != 0:
+                    next_page = self._prefetch_executor.submit(
+                        self._list_connections_page,
+                        {**request_params, "pageToken": next_page_token},
+                    )
 
-            return contacts
+                for person in connections:
+                    yield self._format_contact_enhanced(person)
+
+                if next_page is None:
+                    return
+                results = next_page.result()
+                next_page = None
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error listing contacts: {error}")
+        finally:
+            # Drop a prefetch that has not started when the caller stops early
+            if next_page is not None:
+                next_page.cancel()
+
+    def _list_connections_page(self, request_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one page of people/me connections."""
+        return (
+            self._people.connections()
+            .list(**request_params)
+            .execute(num_retries=config.api_num_retries)
+        )
 
     def search_contacts(
         self, query: str, max_results: int = 50, search_fields: Optional[List[str]] = None
@@ -291,13 +496,13 @@ class GoogleContactsService:
             # Note: This is a newer API that might not be available in all regions
             search_request = {
                 "query": query,
-                "readMask": ",".join(self.PERSON_FIELDS),
+                "readMask": self.ALL_FIELDS_MASK,
                 "pageSize": min(max_results, 50),  # API limit for search
             }
 
             try:
                 # Try the new search API first
-                response = self.service.people().searchContacts(**search_request).execute()
+                response = self._people.searchContacts(**search_request).execute()
                 results = response.get("results", [])
 
                 contacts = []
@@ -311,7 +516,9 @@ class GoogleContactsService:
 
             except HttpError as search_error:
                 # Fallback to manual search if the search API isn't available
-                print(f"Search API not available, falling back to manual search: {search_error}")
+                logger.warning(
+                    "Search API not available, falling back to manual search: %s", search_error
+                )
                 return self._manual_search_contacts(query, max_results, search_fields)
 
         except Exception as error:
@@ -321,8 +528,10 @@ class GoogleContactsService:
         self, query: str, max_results: int = 50, search_fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Fallback manual search with enhanced field matching."""
-        # Get a larger set of contacts to search through
-        all_contacts = self.list_contacts(max_results=max_results * 3, include_all_fields=True)
+        # Scan up to a larger set of contacts, fetching further pages only while needed
+        all_contacts = self.iter_contacts(
+            include_all_fields=True, page_size=max_results * 3, limit=max_results * 3
+        )
 
         query_lower = query.lower()
         matches = []
@@ -341,23 +550,23 @@ class GoogleContactsService:
             ]
 
         for contact in all_contacts:
-            match_found = False
-
+            # Lowercase all searchable values in one pass; NUL keeps matches within one value
+            values = []
             for field in search_fields:
                 field_value = contact.get(field, "")
 
-                # Handle list fields (emails, phones, etc.)
+                # Handle list fields (emails, addresses, etc.) by their values, not their dict reprs
                 if isinstance(field_value, list):
                     for item in field_value:
-                        if query_lower in str(item).lower():
-                            match_found = True
-                            break
+                        if isinstance(item, dict):
+                            values.extend(str(v) for v in item.values() if v)
+                        else:
+                            values.append(str(item))
                 # Handle string fields
-                elif field_value and query_lower in str(field_value).lower():
-                    match_found = True
-                    break
+                elif field_value:
+                    values.append(str(field_value))
 
-            if match_found:
+            if query_lower in "\0".join(values).lower():
                 matches.append(contact)
                 if len(matches) >= max_results:
                     break
@@ -375,21 +584,22 @@ class GoogleContactsService:
             Contact dictionary with comprehensive information
         """
         try:
-            person_fields = (
-                ",".join(self.PERSON_FIELDS)
-                if include_all_fields
-                else "names,emailAddresses,phoneNumbers,addresses,organizations"
-            )
+            person_fields = self.ALL_FIELDS_MASK if include_all_fields else self.BASIC_FIELDS_MASK
 
             if identifier.startswith("people/"):
+                cache_key = (identifier, include_all_fields)
+                contact = self._cache_get(self._contact_cache, cache_key)
+                if contact is not None:
+                    return contact
+
                 # Get by resource name
-                person = (
-                    self.service.people()
-                    .get(resourceName=identifier, personFields=person_fields)
-                    .execute()
-                )
+                person = self._people.get(
+                    resourceName=identifier, personFields=person_fields
+                ).execute()
 
-                return self._format_contact_enhanced(person)
+                contact = self._format_contact_enhanced(person)
+                self._cache_put(self._contact_cache, cache_key, contact)
+                return contact
             else:
                 # Search by email
                 contacts = self.search_contacts(identifier, max_results=1)
@@ -398,7 +608,7 @@ class GoogleContactsService:
 
                 raise GoogleContactsError(f"Contact with identifier {identifier} not found")
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error getting contact: {error}")
 
     def create_contact(self, contact_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -413,95 +623,148 @@ class GoogleContactsService:
         try:
             contact_body = self._build_contact_body(contact_data)
 
-            person = self.service.people().createContact(body=contact_body).execute()
+            person = self._people.createContact(body=contact_body).execute()
+            # System group member counts include the new contact
+            self._group_list_cache.clear()
 
             return self._format_contact_enhanced(person)
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error creating contact: {error}")
 
-    def update_contact(self, resource_name: str, contact_data: Dict[str, Any]) -> Dict[str, Any]:
+    def update_contact(
+        self,
+        resource_name: str,
+        contact_data: Dict[str, Any],
+        *,
+        etag: Optional[str] = None,
+        current_person: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """Update an existing contact with comprehensive field support.
 
         Args:
             resource_name: Contact resource name
             contact_data: Dictionary containing updated contact information
+            etag: Known etag of the contact; skips re-fetching it when no merged field
+                (names, single email or phone, organization) is being updated
+            current_person: Recently fetched person object, used for its etag and for
+                merging into existing names, emails, phones and organization
 
         Returns:
             Updated contact dictionary
         """
         try:
-            # Get current contact for etag
-            current_person = (
-                self.service.people()
-                .get(resourceName=resource_name, personFields=",".join(self.PERSON_FIELDS))
-                .execute()
-            )
-
-            etag = current_person.get("etag")
+            # Fetch the current contact unless the caller supplied it, or supplied the etag
+            # and no field needs merging into existing entries
+            if current_person is None and (
+                etag is None or not self.MERGED_UPDATE_KEYS.isdisjoint(contact_data)
+            ):
+                current_person = self._get_person(resource_name)
+            if etag is None:
+                etag = current_person.get("etag")
 
             # Build update body using the same logic as create
             update_body = self._build_contact_body(contact_data, current_person)
             update_body["etag"] = etag
             update_body["resourceName"] = resource_name
 
-            # Map input fields to API fields for updatePersonFields
-            field_mapping = {
-                "given_name": "names",
-                "family_name": "names",
-                "nickname": "nicknames",
-                "email": "emailAddresses",
-                "emails": "emailAddresses",
-                "phone": "phoneNumbers",
-                "phones": "phoneNumbers",
-                "address": "addresses",
-                "addresses": "addresses",
-                "organization": "organizations",
-                "job_title": "organizations",
-                "birthday": "birthdays",
-                "website": "urls",
-                "urls": "urls",
-                "notes": "biographies",
-                "relations": "relations",
-                "events": "events",
-                "custom_fields": "userDefined",
-            }
-
             # Determine which API fields to update based on input
-            update_fields = set()
-            for input_field in contact_data.keys():
-                if input_field in field_mapping:
-                    update_fields.add(field_mapping[input_field])
+            field_mapping = self.UPDATE_FIELD_MAPPING
+            update_fields = {
+                field_mapping[field] for field in field_mapping.keys() & contact_data.keys()
+            }
 
             if not update_fields:
-                return self._format_contact_enhanced(current_person)
+                return self._format_contact_enhanced(
+                    current_person or self._get_person(resource_name)
+                )
 
             # Execute update
-            updated_person = (
-                self.service.people()
-                .updateContact(
-                    resourceName=resource_name,
-                    updatePersonFields=",".join(update_fields),
-                    body=update_body,
-                )
-                .execute()
-            )
+            updated_person = self._people.updateContact(
+                resourceName=resource_name,
+                updatePersonFields=",".join(update_fields),
+                body=update_body,
+            ).execute()
+            # Invalidate after the update so a concurrent get cannot re-cache the old person
+            self._invalidate_contact(resource_name)
 
             return self._format_contact_enhanced(updated_person)
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error updating contact: {error}")
 
+    def _get_person(self, resource_name: str) -> Dict[str, Any]:
+        """Fetch a raw person object with all fields."""
+        return self._people.get(
+            resourceName=resource_name, personFields=self.ALL_FIELDS_MASK
+        ).execute()
+
     def delete_contact(self, resource_name: str) -> Dict:
         """Delete a contact by resource name."""
         try:
-            self.service.people().deleteContact(resourceName=resource_name).execute()
+            self._people.deleteContact(resourceName=resource_name).execute()
+            self._invalidate_contact(resource_name)
+            self._group_list_cache.clear()
 
             return {"success": True, "resourceName": resource_name}
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error deleting contact: {error}")
 
+    def batch_create_contacts(self, contacts_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create several contacts with as few batchCreateContacts requests as possible.
+
+        Args:
+            contacts_data: List of dictionaries containing contact information
+
+        Returns:
+            List of created contact dictionaries
+        """
+        try:
+            created = []
+            for start in range(0, len(contacts_data), self.BATCH_CREATE_LIMIT):
+                chunk = contacts_data[start : start + self.BATCH_CREATE_LIMIT]
+                body = {
+                    "contacts": [
+                        {"contactPerson": self._build_contact_body(data)} for data in chunk
+                    ],
+                    "readMask": self.ALL_FIELDS_MASK,
+                }
+
+                response = self._people.batchCreateContacts(body=body).execute()
+                self._group_list_cache.clear()
+                for result in response.get("createdPeople", []):
+                    person = result.get("person")
+                    if person:
+                        created.append(self._format_contact_enhanced(person))
+
+            return created
+
+        except API_ERRORS as error:
+            raise GoogleContactsError(f"Error creating contacts: {error}")
+
+    def batch_delete_contacts(self, resource_names: List[str]) -> Dict[str, Any]:
+        """Delete several contacts with as few batchDeleteContacts requests as possible.
+
+        Args:
+            resource_names: List of contact resource names to delete
+
+        Returns:
+            Result dictionary with the number of deleted contacts
+        """
+        try:
+            for start in range(0, len(resource_names), self.BATCH_DELETE_LIMIT):
+                chunk = resource_names[start : start + self.BATCH_DELETE_LIMIT]
+                self._people.batchDeleteContacts(body={"resourceNames": chunk}).execute()
+                self._group_list_cache.clear()
+                for resource_name in chunk:
+                    self._invalidate_contact(resource_name)
+
+            return {"success": True, "deleted_count": len(resource_names)}
+
+        except API_ERRORS as error:
+            raise GoogleContactsError(f"Error deleting contacts: {error}")
+
     def list_directory_people(
         self, query: Optional[str] = None, max_results: int = 50
     ) -> List[Dict]:
@@ -516,11 +779,11 @@ class GoogleContactsService:
         """
         try:
             # Check if directory API access is available
-            directory_fields = "names,emailAddresses,organizations,phoneNumbers"
+            directory_fields = self.DIRECTORY_FIELDS_MASK
 
             # Build the request, with or without a query
             if query:
-                request = self.service.people().searchDirectoryPeople(
+                request = self._people.searchDirectoryPeople(
                     query=query,
                     readMask=directory_fields,
                     sources=[
@@ -530,7 +793,7 @@ class GoogleContactsService:
                     pageSize=max_results,
                 )
             else:
-                request = self.service.people().listDirectoryPeople(
+                request = self._people.listDirectoryPeople(
                     readMask=directory_fields,
                     sources=[
                         "DIRECTORY_SOURCE_TYPE_DOMAIN_CONTACT",
@@ -541,7 +804,6 @@ class GoogleContactsService:
 
             # Execute the request
             response = request.execute()
-            print("response; ", response)
 
             # Process the results
             people = response.get("people", [])
@@ -556,12 +818,14 @@ class GoogleContactsService:
 
             return directory_contacts
 
-        except HttpError as error:
+        except API_ERRORS as error:
             # Handle gracefully if not a Google Workspace account
-            if error.resp.status == 403:
-                print("Directory API access forbidden. This may not be a Google Workspace account.")
+            if isinstance(error, HttpError) and error.resp.status == 403:
+                logger.warning(
+                    "Directory API access forbidden. This may not be a Google Workspace account."
+                )
                 return []
-            raise Exception(f"Error listing directory people: {error}")
+            raise GoogleContactsError(f"Error listing directory people: {error}")
 
     def search_directory(self, query: str, max_results: int = 20) -> List[Dict]:
         """Search for people in the Google Workspace directory.
@@ -576,19 +840,15 @@ class GoogleContactsService:
             List of matching directory contact dictionaries
         """
         try:
-            response = (
-                self.service.people()
-                .searchDirectoryPeople(
-                    query=query,
-                    readMask="names,emailAddresses,organizations,phoneNumbers",
-                    sources=[
-                        "DIRECTORY_SOURCE_TYPE_DOMAIN_CONTACT",
-                        "DIRECTORY_SOURCE_TYPE_DOMAIN_PROFILE",
-                    ],
-                    pageSize=max_results,
-                )
-                .execute()
-            )
+            response = self._people.searchDirectoryPeople(
+                query=query,
+                readMask=self.DIRECTORY_FIELDS_MASK,
+                sources=[
+                    "DIRECTORY_SOURCE_TYPE_DOMAIN_CONTACT",
+                    "DIRECTORY_SOURCE_TYPE_DOMAIN_PROFILE",
+                ],
+                pageSize=max_results,
+            ).execute()
 
             people = response.get("people", [])
 
@@ -603,13 +863,13 @@ class GoogleContactsService:
 
             return directory_results
 
-        except HttpError as error:
-            if error.resp.status == 403:
-                print(
+        except API_ERRORS as error:
+            if isinstance(error, HttpError) and error.resp.status == 403:
+                logger.warning(
                     "Directory search access forbidden. This may not be a Google Workspace account."
                 )
                 return []
-            raise Exception(f"Error searching directory: {error}")
+            raise GoogleContactsError(f"Error searching directory: {error}")
 
     def get_other_contacts(self, max_results: int = 100) -> List[Dict]:
         """Get contacts from the 'Other contacts' section of Google Contacts.
@@ -642,19 +902,37 @@ class GoogleContactsService:
 
             return contacts
 
-        except HttpError as error:
-            raise Exception(f"Error getting other contacts: {error}")
+        except API_ERRORS as error:
+            raise GoogleContactsError(f"Error getting other contacts: {error}")
+
+    @staticmethod
+    def _first_entry(person: Dict[str, Any], key: str) -> Dict[str, Any]:
+        """Return the first entry of a person's list field, or an empty dict if it has none."""
+        entries = person.get(key)
+        return entries[0] if entries else {}
+
+    @classmethod
+    def _name_matches(cls, person: Dict[str, Any], filter_lower: str) -> bool:
+        """Check whether a person's primary name or nickname contains the lowercased filter."""
+        name = cls._first_entry(person, "names")
+        nickname = cls._first_entry(person, "nicknames")
+        return any(
+            filter_lower in str(value).lower()
+            for value in (
+                name.get("displayName", ""),
+                name.get("givenName", ""),
+                name.get("familyName", ""),
+                nickname.get("value", ""),
+            )
+        )
 
     def _format_contact(self, person: Dict) -> Dict:
         """Format a Google People API person object into a simplified contact."""
-        names = person.get("names", [])
-        emails = person.get("emailAddresses", [])
-        phones = person.get("phoneNumbers", [])
-
-        given_name = names[0].get("givenName", "") if names else ""
-        family_name = names[0].get("familyName", "") if names else ""
+        name = self._first_entry(person, "names")
+        given_name = name.get("givenName", "")
+        family_name = name.get("familyName", "")
         display_name = (
-            names[0].get("displayName", "") if names else f"{given_name} {family_name}".strip()
+            name.get("displayName", "") if name else f"{given_name} {family_name}".strip()
         )
 
         return {
@@ -662,8 +940,8 @@ class GoogleContactsService:
             "givenName": given_name,
             "familyName": family_name,
             "displayName": display_name,
-            "email": emails[0].get("value") if emails else None,
-            "phone": phones[0].get("value") if phones else None,
+            "email": self._first_entry(person, "emailAddresses").get("value"),
+            "phone": self._first_entry(person, "phoneNumbers").get("value"),
         }
 
     def _format_directory_person(self, person: Dict) -> Dict:
@@ -672,33 +950,25 @@ class GoogleContactsService:
         This handles the specific format of directory contacts which may have different
         organization and other fields compared to regular contacts.
         """
-        names = person.get("names", [])
-        emails = person.get("emailAddresses", [])
-        phones = person.get("phoneNumbers", [])
-        orgs = person.get("organizations", [])
-
-        given_name = names[0].get("givenName", "") if names else ""
-        family_name = names[0].get("familyName", "") if names else ""
+        name = self._first_entry(person, "names")
+        given_name = name.get("givenName", "")
+        family_name = name.get("familyName", "")
         display_name = (
-            names[0].get("displayName", "") if names else f"{given_name} {family_name}".strip()
+            name.get("displayName", "") if name else f"{given_name} {family_name}".strip()
         )
 
         # Get organization details - these are often present in directory entries
-        department = ""
-        job_title = ""
-        if orgs:
-            department = orgs[0].get("department", "")
-            job_title = orgs[0].get("title", "")
+        org = self._first_entry(person, "organizations")
 
         return {
             "resourceName": person.get("resourceName"),
             "givenName": given_name,
             "familyName": family_name,
             "displayName": display_name,
-            "email": emails[0].get("value") if emails else None,
-            "phone": phones[0].get("value") if phones else None,
-            "department": department,
-            "jobTitle": job_title,
+            "email": self._first_entry(person, "emailAddresses").get("value"),
+            "phone": self._first_entry(person, "phoneNumbers").get("value"),
+            "department": org.get("department", ""),
+            "jobTitle": org.get("title", ""),
         }
 
     def _build_contact_body(
@@ -717,6 +987,11 @@ class GoogleContactsService:
 
         return body
 
+    @staticmethod
+    def _wrap_entries(entries: List[Any], value_key: str) -> List[Dict[str, Any]]:
+        """Wrap plain string entries as {value_key: entry} dicts, passing dicts through as-is."""
+        return [{value_key: entry} if type(entry) is str else entry for entry in entries]
+
     def _build_names_section(
         self,
         body: Dict[str, Any],
@@ -762,13 +1037,7 @@ class GoogleContactsService:
     ) -> None:
         """Build email addresses section of contact body."""
         if "emails" in contact_data:
-            emails = []
-            for email_data in contact_data["emails"]:
-                if isinstance(email_data, str):
-                    emails.append({"value": email_data})
-                else:
-                    emails.append(email_data)
-            body["emailAddresses"] = emails
+            body["emailAddresses"] = self._wrap_entries(contact_data["emails"], "value")
         elif "email" in contact_data:
             # For single email updates, preserve existing emails or create new
             if current_person and current_person.get("emailAddresses"):
@@ -790,13 +1059,7 @@ class GoogleContactsService:
     ) -> None:
         """Build phone numbers section of contact body."""
         if "phones" in contact_data:
-            phones = []
-            for phone_data in contact_data["phones"]:
-                if isinstance(phone_data, str):
-                    phones.append({"value": phone_data})
-                else:
-                    phones.append(phone_data)
-            body["phoneNumbers"] = phones
+            body["phoneNumbers"] = self._wrap_entries(contact_data["phones"], "value")
         elif "phone" in contact_data:
             # For single phone updates, preserve existing phones or create new
             if current_person and current_person.get("phoneNumbers"):
@@ -813,13 +1076,7 @@ class GoogleContactsService:
     def _build_addresses_section(self, body: Dict[str, Any], contact_data: Dict[str, Any]) -> None:
         """Build addresses section of contact body."""
         if "addresses" in contact_data:
-            addresses = []
-            for addr_data in contact_data["addresses"]:
-                if isinstance(addr_data, str):
-                    addresses.append({"formattedValue": addr_data})
-                else:
-                    addresses.append(addr_data)
-            body["addresses"] = addresses
+            body["addresses"] = self._wrap_entries(contact_data["addresses"], "formattedValue")
         elif "address" in contact_data:
             body["addresses"] = [{"formattedValue": contact_data["address"]}]
 
@@ -852,29 +1109,28 @@ class GoogleContactsService:
             birthday_data = contact_data["birthday"]
             if isinstance(birthday_data, str):
                 # Parse string format like "1990-01-15"
-                parts = birthday_data.split("-")
-                if len(parts) == 3:
-                    body["birthdays"] = [
-                        {
-                            "date": {
-                                "year": int(parts[0]),
-                                "month": int(parts[1]),
-                                "day": int(parts[2]),
-                            }
-                        }
-                    ]
+                try:
+                    parsed = date.fromisoformat(birthday_data)
+                    year, month, day = parsed.year, parsed.month, parsed.day
+                except ValueError:
+                    # Fall back to lenient splitting for non-ISO inputs such as "1990-1-5"
+                    parts = birthday_data.split("-")
+                    try:
+                        year, month, day = (
+                            map(int, parts) if len(parts) == 3 else (None, None, None)
+                        )
+                    except ValueError:
+                        raise GoogleContactsError(
+                            f"Invalid birthday '{birthday_data}', expected YYYY-MM-DD"
+                        )
+                if year is not None:
+                    body["birthdays"] = [{"date": {"year": year, "month": month, "day": day}}]
             else:
                 body["birthdays"] = [birthday_data]
 
         # URLs
         if "urls" in contact_data:
-            urls = []
-            for url_data in contact_data["urls"]:
-                if isinstance(url_data, str):
-                    urls.append({"value": url_data})
-                else:
-                    urls.append(url_data)
-            body["urls"] = urls
+            body["urls"] = self._wrap_entries(contact_data["urls"], "value")
         elif "website" in contact_data:
             body["urls"] = [{"value": contact_data["website"]}]
 
@@ -888,13 +1144,7 @@ class GoogleContactsService:
         """Build additional fields section (relations, events, custom fields) of contact body."""
         # Relations
         if "relations" in contact_data:
-            relations = []
-            for rel_data in contact_data["relations"]:
-                if isinstance(rel_data, str):
-                    relations.append({"person": rel_data})
-                else:
-                    relations.append(rel_data)
-            body["relations"] = relations
+            body["relations"] = self._wrap_entries(contact_data["relations"], "person")
 
         # Events (like anniversaries)
         if "events" in contact_data:
@@ -917,93 +1167,67 @@ class GoogleContactsService:
 
         return contact
 
+    @staticmethod
+    def _map_entry(entry: Dict[str, Any], spec: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+        """Translate one People API entry into a contact dict using an (output, source) spec."""
+        return {out_key: entry.get(src_key, "") for out_key, src_key in spec}
+
+    @classmethod
+    def _map_entries(
+        cls, person: Dict[str, Any], key: str, spec: Tuple[Tuple[str, str], ...]
+    ) -> List[Dict[str, Any]]:
+        """Translate every entry of a person's list field using an (output, source) spec."""
+        return [cls._map_entry(entry, spec) for entry in person.get(key, ())]
+
+    @staticmethod
+    def _set_if_present(contact: Dict[str, Any], key: str, entries: List[Dict[str, Any]]) -> None:
+        """Store a list field on the contact only when it has entries."""
+        if entries:
+            contact[key] = entries
+
     def _format_names_data(self, contact: Dict[str, Any], person: Dict[str, Any]) -> None:
         """Format names and nicknames data from person object."""
         # Names
-        names = person.get("names", [])
+        names = person.get("names", ())
         if names:
-            name = names[0]
-            contact.update(
-                {
-                    "givenName": name.get("givenName", ""),
-                    "familyName": name.get("familyName", ""),
-                    "displayName": name.get("displayName", ""),
-                    "middleName": name.get("middleName", ""),
-                    "honorificPrefix": name.get("honorificPrefix", ""),
-                    "honorificSuffix": name.get("honorificSuffix", ""),
-                }
-            )
+            contact.update(self._map_entry(names[0], self.NAME_SPEC))
 
         # Nicknames
-        nicknames = person.get("nicknames", [])
+        nicknames = person.get("nicknames", ())
         if nicknames:
             contact["nickname"] = nicknames[0].get("value", "")
 
     def _format_contact_data(self, contact: Dict[str, Any], person: Dict[str, Any]) -> None:
         """Format contact information (emails, phones, addresses) from person object."""
         # Email addresses
-        emails = person.get("emailAddresses", [])
-        contact["emails"] = []
-        for email in emails:
-            contact["emails"].append(
-                {
-                    "value": email.get("value", ""),
-                    "type": email.get("type", ""),
-                    "label": email.get("formattedType", ""),
-                }
-            )
-        # Keep backward compatibility
+        emails = self._map_entries(person, "emailAddresses", self.TYPED_VALUE_SPEC)
         if emails:
-            contact["email"] = emails[0].get("value", "")
+            contact["emails"] = emails
+            # Keep backward compatibility
+            contact["email"] = emails[0]["value"]
 
         # Phone numbers
-        phones = person.get("phoneNumbers", [])
-        contact["phones"] = []
-        for phone in phones:
-            contact["phones"].append(
-                {
-                    "value": phone.get("value", ""),
-                    "type": phone.get("type", ""),
-                    "label": phone.get("formattedType", ""),
-                }
-            )
-        # Keep backward compatibility
+        phones = self._map_entries(person, "phoneNumbers", self.TYPED_VALUE_SPEC)
         if phones:
-            contact["phone"] = phones[0].get("value", "")
+            contact["phones"] = phones
+            # Keep backward compatibility
+            contact["phone"] = phones[0]["value"]
 
         # Addresses
-        addresses = person.get("addresses", [])
-        contact["addresses"] = []
-        for addr in addresses:
-            contact["addresses"].append(
-                {
-                    "formatted": addr.get("formattedValue", ""),
-                    "type": addr.get("type", ""),
-                    "street": addr.get("streetAddress", ""),
-                    "city": addr.get("city", ""),
-                    "region": addr.get("region", ""),
-                    "postal_code": addr.get("postalCode", ""),
-                    "country": addr.get("country", ""),
-                }
-            )
+        self._set_if_present(
+            contact, "addresses", self._map_entries(person, "addresses", self.ADDRESS_SPEC)
+        )
 
     def _format_organization_data(self, contact: Dict[str, Any], person: Dict[str, Any]) -> None:
         """Format organization data from person object."""
-        organizations = person.get("organizations", [])
+        organizations = person.get("organizations", ())
         if organizations:
-            org = organizations[0]
-            contact.update(
-                {
-                    "organization": org.get("name", ""),
-                    "jobTitle": org.get("title", ""),
-                    "department": org.get("department", ""),
-                }
-            )
+            contact.update(self._map_entry(organizations[0], self.ORGANIZATION_SPEC))
 
     def _format_personal_data(self, contact: Dict[str, Any], person: Dict[str, Any]) -> None:
         """Format personal data (birthday, URLs, notes) from person object."""
         # Birthday
-        birthdays = person.get("birthdays", [])
+        birthdays = person.get("birthdays", ())
         if birthdays:
             birthday = birthdays[0].get("date", {})
             if birthday:
@@ -1014,69 +1238,61 @@ class GoogleContactsService:
                 }
 
         # URLs
-        urls = person.get("urls", [])
-        contact["urls"] = []
-        for url in urls:
-            contact["urls"].append(
-                {
-                    "value": url.get("value", ""),
-                    "type": url.get("type", ""),
-                    "label": url.get("formattedType", ""),
-                }
-            )
+        self._set_if_present(
+            contact, "urls", self._map_entries(person, "urls", self.TYPED_VALUE_SPEC)
+        )
 
         # Biography/Notes
-        biographies = person.get("biographies", [])
+        biographies = person.get("biographies", ())
         if biographies:
             contact["notes"] = biographies[0].get("value", "")
 
     def _format_additional_data(self, contact: Dict[str, Any], person: Dict[str, Any]) -> None:
         """Format additional data (relations, events, custom fields, etc.) from person object."""
         # Relations
-        relations = person.get("relations", [])
-        contact["relations"] = []
-        for relation in relations:
-            contact["relations"].append(
-                {
-                    "person": relation.get("person", ""),
-                    "type": relation.get("type", ""),
-                    "label": relation.get("formattedType", ""),
-                }
-            )
+        self._set_if_present(
+            contact, "relations", self._map_entries(person, "relations", self.RELATION_SPEC)
+        )
 
         # Events
-        events = person.get("events", [])
-        contact["events"] = []
-        for event in events:
-            event_data = {"type": event.get("type", ""), "label": event.get("formattedType", "")}
-            if event.get("date"):
-                event_data["date"] = event["date"]
-            contact["events"].append(event_data)
+        self._set_if_present(
+            contact, "events", [self._format_event(event) for event in person.get("events", ())]
+        )
 
         # Custom fields
-        custom_fields = person.get("userDefined", [])
-        contact["customFields"] = []
-        for field in custom_fields:
-            contact["customFields"].append(
-                {"key": field.get("key", ""), "value": field.get("value", "")}
-            )
+        self._set_if_present(
+            contact,
+            "customFields",
+            self._map_entries(person, "userDefined", self.CUSTOM_FIELD_SPEC),
+        )
 
         # Photos
-        photos = person.get("photos", [])
+        photos = person.get("photos", ())
         if photos:
             contact["photoUrl"] = photos[0].get("url", "")
 
         # Memberships (contact groups)
-        memberships = person.get("memberships", [])
-        contact["groups"] = []
-        for membership in memberships:
-            contact["groups"].append(
+        self._set_if_present(
+            contact,
+            "groups",
+            [
                 {
                     "resourceName": membership.get("contactGroupMembership", {}).get(
                         "contactGroupResourceName", ""
                     )
                 }
-            )
+                for membership in person.get("memberships", ())
+            ],
+        )
+
+    @staticmethod
+    def _format_event(event: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a single event entry, keeping its date only when present."""
+        event_data = {"type": event.get("type", ""), "label": event.get("formattedType", "")}
+        date_value = event.get("date")
+        if date_value:
+            event_data["date"] = date_value
+        return event_data
 
     def list_contact_groups(self, include_system_groups: bool = True) -> List[Dict[str, Any]]:
         """List all contact groups owned by the authenticated user.
@@ -1087,25 +1303,41 @@ class GoogleContactsService:
         Returns:
             List of contact group dictionaries
         """
-        try:
-            response = self.service.contactGroups().list().execute()
-            contact_groups = response.get("contactGroups", [])
+        groups = self._cache_get(self._group_list_cache, include_system_groups)
+        if groups is None:
+            groups = list(self.iter_contact_groups(include_system_groups))
+            self._cache_put(self._group_list_cache, include_system_groups, groups)
+        return groups
+
+    def iter_contact_groups(self, include_system_groups: bool = True) -> Iterator[Dict[str, Any]]:
+        """Iterate over contact groups, requesting each page only when the previous one is consumed.
+
+        Args:
+            include_system_groups: Whether to include system contact groups
+
+        Yields:
+            Contact group dictionaries
+
+        Raises:
+            GoogleContactsError: If API request fails
+        """
+        request_params = {"pageSize": 1000, "fields": self.GROUP_LIST_FIELDS}
 
-            if not include_system_groups:
-                contact_groups = [
-                    group
-                    for group in contact_groups
-                    if group.get("groupType") == "USER_CONTACT_GROUP"
-                ]
+        try:
+            while True:
+                response = self._contact_groups.list(**request_params).execute()
 
-            formatted_groups = []
-            for group in contact_groups:
-                formatted_group = self._format_contact_group(group)
-                formatted_groups.append(formatted_group)
+                for group in response.get("contactGroups", []):
+                    if include_system_groups or group.get("groupType") == "USER_CONTACT_GROUP":
+                        self._remember_group_etag(group)
+                        yield self._format_contact_group(group)
 
-            return formatted_groups
+                next_page_token = response.get("nextPageToken")
+                if not next_page_token:
+                    return
+                request_params["pageToken"] = next_page_token
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error listing contact groups: {error}")
 
     def create_contact_group(
@@ -1126,10 +1358,12 @@ class GoogleContactsService:
             if client_data:
                 contact_group_body["contactGroup"]["clientData"] = client_data
 
-            response = self.service.contactGroups().create(body=contact_group_body).execute()
+            response = self._contact_groups.create(body=contact_group_body).execute()
+            self._group_list_cache.clear()
+            self._remember_group_etag(response)
             return self._format_contact_group(response)
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error creating contact group: {error}")
 
     def get_contact_group(self, resource_name: str, max_members: int = 0) -> Dict[str, Any]:
@@ -1147,15 +1381,55 @@ class GoogleContactsService:
             if max_members > 0:
                 params["maxMembers"] = max_members
 
-            response = (
-                self.service.contactGroups().get(resourceName=resource_name, **params).execute()
-            )
+            response = self._contact_groups.get(resourceName=resource_name, **params).execute()
+            self._remember_group_etag(response)
 
             return self._format_contact_group(response, include_members=max_members > 0)
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error getting contact group: {error}")
 
+    def get_contacts_batch(
+        self, resource_names: List[str], include_all_fields: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get several contacts by resource name with as few round trips as possible.
+
+        Contacts are fetched with people().getBatchGet in chunks of BATCH_GET_LIMIT, with the
+        chunks requested concurrently. Contacts that cannot be retrieved are skipped.
+
+        Args:
+            resource_names: Contact resource names (people/*)
+            include_all_fields: Whether to include all contact fields
+
+        Returns:
+            List of contact dictionaries, in the order they were requested
+        """
+        chunks = [
+            resource_names[start : start + self.BATCH_GET_LIMIT]
+            for start in range(0, len(resource_names), self.BATCH_GET_LIMIT)
+        ]
+        if not chunks:
+            return []
+        person_fields = self.ALL_FIELDS_MASK if include_all_fields else self.BASIC_FIELDS_MASK
+
+        def fetch(names: List[str]) -> Dict[str, Any]:
+            return self._people.getBatchGet(
+                resourceNames=names, personFields=person_fields
+            ).execute()
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), 8)) as executor:
+                responses = list(executor.map(fetch, chunks))
+        except API_ERRORS as error:
+            raise GoogleContactsError(f"Error getting contacts: {error}")
+
+        return [
+            self._format_contact_enhanced(result["person"])
+            for response in responses
+            for result in response.get("responses", [])
+            if "person" in result
+        ]
+
     def update_contact_group(
         self, resource_name: str, name: str, client_data: Optional[List[Dict[str, str]]] = None
     ) -> Dict[str, Any]:
@@ -1169,34 +1443,65 @@ class GoogleContactsService:
         Returns:
             Updated contact group dictionary
         """
-        try:
-            # Get current group for etag
-            current_group = self.service.contactGroups().get(resourceName=resource_name).execute()
-
-            contact_group_body = {
-                "contactGroup": {
-                    "resourceName": resource_name,
-                    "etag": current_group.get("etag"),
-                    "name": name,
-                },
-                "updateGroupFields": "name",
-            }
+        contact_group_body = {
+            "contactGroup": {"resourceName": resource_name, "name": name},
+            "updateGroupFields": "name",
+        }
 
-            if client_data:
-                contact_group_body["contactGroup"]["clientData"] = client_data
-                contact_group_body["updateGroupFields"] = "name,clientData"
+        if client_data:
+            contact_group_body["contactGroup"]["clientData"] = client_data
+            contact_group_body["updateGroupFields"] = "name,clientData"
 
-            response = (
-                self.service.contactGroups()
-                .update(contactGroup_resourceName=resource_name, body=contact_group_body)
-                .execute()
+        try:
+            # Reuse the etag from an earlier list/get/create/update when we have one
+            etag = self._group_etags.get(resource_name)
+            if etag is not None:
+                try:
+                    return self._send_group_update(resource_name, contact_group_body, etag)
+                except HttpError as error:
+                    # Retry once with a freshly fetched etag only if the cached one is stale
+                    self._group_etags.pop(resource_name, None)
+                    if not self._is_etag_mismatch(error):
+                        raise
+
+            current_group = self._contact_groups.get(
+                resourceName=resource_name, fields="etag"
+            ).execute()
+            return self._send_group_update(
+                resource_name, contact_group_body, current_group.get("etag")
             )
 
-            return self._format_contact_group(response)
-
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error updating contact group: {error}")
 
+    def _send_group_update(
+        self, resource_name: str, contact_group_body: Dict[str, Any], etag: Optional[str]
+    ) -> Dict[str, Any]:
+        """Issue a contactGroups().update with the given etag and format the response."""
+        contact_group_body["contactGroup"]["etag"] = etag
+        response = self._contact_groups.update(
+            contactGroup_resourceName=resource_name, body=contact_group_body
+        ).execute()
+        self._group_list_cache.clear()
+        self._remember_group_etag(response)
+        return self._format_contact_group(response)
+
+    def _remember_group_etag(self, group: Dict[str, Any]) -> None:
+        """Remember a group's etag so later updates can skip fetching the group first."""
+        if group.get("etag") and group.get("resourceName"):
+            self._group_etags[group["resourceName"]] = group["etag"]
+
+    @staticmethod
+    def _is_etag_mismatch(error: HttpError) -> bool:
+        """Return whether an update failed because the supplied etag is out of date."""
+        if error.resp.status == 412:
+            return True
+        try:
+            status = json.loads(error.content).get("error", {}).get("status")
+        except (ValueError, AttributeError):
+            return False
+        return status == "FAILED_PRECONDITION"
+
     def delete_contact_group(self, resource_name: str) -> Dict[str, Any]:
         """Delete a contact group.
 
@@ -1207,10 +1512,14 @@ class GoogleContactsService:
             Success status dictionary
         """
         try:
-            self.service.contactGroups().delete(resourceName=resource_name).execute()
+            self._contact_groups.delete(resourceName=resource_name).execute()
+            self._group_etags.pop(resource_name, None)
+            self._group_list_cache.clear()
+            # Cached member contacts still list the deleted group in their memberships
+            self._contact_cache.clear()
             return {"success": True, "resourceName": resource_name}
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error deleting contact group: {error}")
 
     def add_contacts_to_group(
@@ -1226,23 +1535,18 @@ class GoogleContactsService:
             Result dictionary with any errors
         """
         try:
-            modify_body = {"resourceNamesToAdd": contact_resource_names}
-
-            response = (
-                self.service.contactGroups()
-                .members()
-                .modify(resourceName=group_resource_name, body=modify_body)
-                .execute()
+            not_found, last_group = self._modify_group_members(
+                group_resource_name, "resourceNamesToAdd", contact_resource_names
             )
 
             return {
                 "success": True,
                 "added_count": len(contact_resource_names),
-                "not_found": response.get("notFoundResourceNames", []),
-                "could_not_add": response.get("canNotRemoveLastContactGroupResourceNames", []),
+                "not_found": not_found,
+                "could_not_add": last_group,
             }
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error adding contacts to group: {error}")
 
     def remove_contacts_from_group(
@@ -1258,25 +1562,44 @@ class GoogleContactsService:
             Result dictionary with any errors
         """
         try:
-            modify_body = {"resourceNamesToRemove": contact_resource_names}
-
-            response = (
-                self.service.contactGroups()
-                .members()
-                .modify(resourceName=group_resource_name, body=modify_body)
-                .execute()
+            not_found, last_group = self._modify_group_members(
+                group_resource_name, "resourceNamesToRemove", contact_resource_names
             )
 
             return {
                 "success": True,
                 "removed_count": len(contact_resource_names),
-                "not_found": response.get("notFoundResourceNames", []),
-                "could_not_remove": response.get("canNotRemoveLastContactGroupResourceNames", []),
+                "not_found": not_found,
+                "could_not_remove": last_group,
             }
 
-        except HttpError as error:
+        except API_ERRORS as error:
             raise GoogleContactsError(f"Error removing contacts from group: {error}")
 
+    def _modify_group_members(
+        self, group_resource_name: str, body_key: str, contact_resource_names: List[str]
+    ) -> Tuple[List[str], List[str]]:
+        """Send members().modify requests in chunks of at most GROUP_MODIFY_LIMIT names.
+
+        Returns:
+            Merged notFoundResourceNames and canNotRemoveLastContactGroupResourceNames lists
+        """
+        # Member counts and contact memberships change, so cached lookups go stale
+        self._group_list_cache.clear()
+        for resource_name in contact_resource_names:
+            self._invalidate_contact(resource_name)
+
+        not_found = []
+        last_group = []
+        for start in range(0, len(contact_resource_names), self.GROUP_MODIFY_LIMIT):
+            chunk = contact_resource_names[start : start + self.GROUP_MODIFY_LIMIT]
+            response = self._group_members.modify(
+                resourceName=group_resource_name, body={body_key: chunk}
+            ).execute()
+            not_found.extend(response.get("notFoundResourceNames", []))
+            last_group.extend(response.get("canNotRemoveLastContactGroupResourceNames", []))
+        return not_found, last_group
+
     def _format_contact_group(
         self, group: Dict[str, Any], include_members: bool = False
     ) -> Dict[str, Any]:
@@ -1294,7 +1617,7 @@ class GoogleContactsService:
             "name": group.get("name", ""),
             "formattedName": group.get("formattedName", ""),
             "groupType": group.get("groupType", ""),
-            "memberCount": group.get("memberCount", 0),
+            "memberCount": group.get("memberCount") or 0,
         }
 
         # Add metadata if available
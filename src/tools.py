@@ -1,7 +1,10 @@
 """MCP tools implementation for Google Contacts."""
 
-import traceback
-from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 
@@ -16,8 +19,13 @@ from formatters import (
 )
 from google_contacts_service import GoogleContactsError, GoogleContactsService
 
-# Global service instance
+logger = logging.getLogger(__name__)
+
+# Global service instance, created once under _service_lock
 contacts_service = None
+_service_lock = threading.Lock()
+
+_ERR_NO_SERVICE = "Error: Google Contacts service is not available. Please check your credentials."
 
 
 def init_service() -> Optional[GoogleContactsService]:
@@ -28,15 +36,25 @@ def init_service() -> Optional[GoogleContactsService]:
     """
     global contacts_service
 
-    if contacts_service:
+    # Fast path: no lock once the service exists
+    service = contacts_service
+    if service is not None:
+        return service
+
+    with _service_lock:
+        if contacts_service is None:
+            contacts_service = _create_service()
         return contacts_service
 
+
+def _create_service() -> Optional[GoogleContactsService]:
+    """Create a service from environment variables or the first usable credentials file."""
     try:
         # First try environment variables
         try:
-            contacts_service = GoogleContactsService.from_env()
-            print("Successfully loaded credentials from environment variables.")
-            return contacts_service
+            service = GoogleContactsService.from_env()
+            logger.info("Successfully loaded credentials from environment variables.")
+            return service
         except GoogleContactsError:
             pass
 
@@ -44,23 +62,52 @@ def init_service() -> Optional[GoogleContactsService]:
         for path in config.credentials_paths:
             if path.exists():
                 try:
-                    print(f"Found credentials file at {path}")
-                    contacts_service = GoogleContactsService.from_file(path)
-                    print("Successfully loaded credentials from file.")
-                    return contacts_service
+                    logger.info("Found credentials file at %s", path)
+                    service = GoogleContactsService.from_file(path)
+                    logger.info("Successfully loaded credentials from file.")
+                    return service
                 except GoogleContactsError as e:
-                    print(f"Error with credentials at {path}: {e}")
+                    logger.warning("Error with credentials at %s: %s", path, e)
                     continue
 
-        print("No valid credentials found. Please provide credentials to use Google Contacts.")
+        logger.warning(
+            "No valid credentials found. Please provide credentials to use Google Contacts."
+        )
         return None
 
     except Exception as e:
-        print(f"Error initializing Google Contacts service: {str(e)}")
-        traceback.print_exc()
+        logger.exception("Error initializing Google Contacts service: %s", e)
         return None
 
 
+def with_timeout(tool: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Stop waiting on a tool call that runs longer than config.tool_timeout_seconds.
+
+    Only the coroutine is cancelled; an API call already running in a worker thread
+    keeps running until it returns, and its result is discarded.
+
+    Args:
+        tool: Async tool function returning a string result
+
+    Returns:
+        Wrapped tool function with the same signature
+    """
+
+    @functools.wraps(tool)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        timeout = config.tool_timeout_seconds
+        try:
+            async with asyncio.timeout(timeout) as deadline:
+                return await tool(*args, **kwargs)
+        except TimeoutError:
+            # A TimeoutError raised by the tool itself (e.g. a socket timeout) is not ours
+            if not deadline.expired():
+                raise
+            return f"Error: Timed out after {timeout:g} seconds"
+
+    return wrapper
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register all Google Contacts tools with the MCP server.
 
@@ -68,6 +115,7 @@ def register_tools(mcp: FastMCP) -> None:
         mcp: FastMCP server instance
     """
     register_contact_tools(mcp)
+    register_batch_contact_tools(mcp)
     register_directory_tools(mcp)
     register_contact_group_tools(mcp)
 
@@ -76,6 +124,7 @@ def register_contact_tools(mcp: FastMCP) -> None:
     """Register contact management tools with the MCP server."""
 
     @mcp.tool()
+    @with_timeout
     async def list_contacts(
         name_filter: Optional[str] = None, max_results: int = 100, include_all_fields: bool = False
     ) -> str:
@@ -88,15 +137,17 @@ def register_contact_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            contacts = service.list_contacts(name_filter, max_results, include_all_fields)
-            return format_contacts_list(contacts)
-        except Exception as e:
+            # Format contacts as their pages arrive rather than collecting them first
+            contacts = service.stream_contacts(name_filter, max_results, include_all_fields)
+            return await asyncio.to_thread(format_contacts_list, contacts)
+        except GoogleContactsError as e:
             return f"Error: Failed to list contacts - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def search_contacts(
         query: str, max_results: int = 50, search_fields: Optional[List[str]] = None
     ) -> str:
@@ -111,19 +162,22 @@ def register_contact_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            contacts = service.search_contacts(query, max_results, search_fields)
+            contacts = await asyncio.to_thread(
+                service.search_contacts, query, max_results, search_fields
+            )
 
             if not contacts:
                 return f"No contacts found matching '{query}'."
 
             return f"Search results for '{query}':\n\n{format_contacts_list(contacts)}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to search contacts - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def get_contact(identifier: str, include_all_fields: bool = True) -> str:
         """Get a contact by resource name or email with comprehensive information.
 
@@ -133,15 +187,16 @@ def register_contact_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            contact = service.get_contact(identifier, include_all_fields)
+            contact = await asyncio.to_thread(service.get_contact, identifier, include_all_fields)
             return format_contact(contact)
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to get contact - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def create_contact(
         given_name: str,
         family_name: Optional[str] = None,
@@ -172,39 +227,32 @@ def register_contact_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
+            # Add optional fields if provided
+            optional_fields = {
+                "family_name": family_name,
+                "email": email,
+                "phone": phone,
+                "organization": organization,
+                "job_title": job_title,
+                "address": address,
+                "birthday": birthday,
+                "website": website,
+                "notes": notes,
+                "nickname": nickname,
+            }
             contact_data = {"given_name": given_name}
+            contact_data.update({key: value for key, value in optional_fields.items() if value})
 
-            # Add optional fields if provided
-            if family_name:
-                contact_data["family_name"] = family_name
-            if email:
-                contact_data["email"] = email
-            if phone:
-                contact_data["phone"] = phone
-            if organization:
-                contact_data["organization"] = organization
-            if job_title:
-                contact_data["job_title"] = job_title
-            if address:
-                contact_data["address"] = address
-            if birthday:
-                contact_data["birthday"] = birthday
-            if website:
-                contact_data["website"] = website
-            if notes:
-                contact_data["notes"] = notes
-            if nickname:
-                contact_data["nickname"] = nickname
-
-            contact = service.create_contact(contact_data)
+            contact = await asyncio.to_thread(service.create_contact, contact_data)
             return f"Contact created successfully!\n\n{format_contact(contact)}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to create contact - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def create_contact_advanced(contact_data: Dict[str, Any]) -> str:
         """Create a new contact with full field support including multiple emails, phones, addresses, etc.
 
@@ -219,15 +267,16 @@ def register_contact_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            contact = service.create_contact(contact_data)
+            contact = await asyncio.to_thread(service.create_contact, contact_data)
             return f"Advanced contact created successfully!\n\n{format_contact(contact)}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to create advanced contact - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def update_contact(
         resource_name: str,
         given_name: Optional[str] = None,
@@ -258,46 +307,38 @@ def register_contact_tools(mcp: FastMCP) -> None:
             notes: Updated notes or biography
             nickname: Updated nickname
         """
+        # Add fields that are being updated
+        updated_fields = {
+            "given_name": given_name,
+            "family_name": family_name,
+            "email": email,
+            "phone": phone,
+            "organization": organization,
+            "job_title": job_title,
+            "address": address,
+            "birthday": birthday,
+            "website": website,
+            "notes": notes,
+            "nickname": nickname,
+        }
+        contact_data = {key: value for key, value in updated_fields.items() if value is not None}
+
+        # Reject empty updates before touching the service
+        if not contact_data:
+            return "Error: No fields provided for update."
+
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            contact_data = {}
-
-            # Add fields that are being updated
-            if given_name is not None:
-                contact_data["given_name"] = given_name
-            if family_name is not None:
-                contact_data["family_name"] = family_name
-            if email is not None:
-                contact_data["email"] = email
-            if phone is not None:
-                contact_data["phone"] = phone
-            if organization is not None:
-                contact_data["organization"] = organization
-            if job_title is not None:
-                contact_data["job_title"] = job_title
-            if address is not None:
-                contact_data["address"] = address
-            if birthday is not None:
-                contact_data["birthday"] = birthday
-            if website is not None:
-                contact_data["website"] = website
-            if notes is not None:
-                contact_data["notes"] = notes
-            if nickname is not None:
-                contact_data["nickname"] = nickname
-
-            if not contact_data:
-                return "Error: No fields provided for update."
-
-            contact = service.update_contact(resource_name, contact_data)
+            contact = await asyncio.to_thread(service.update_contact, resource_name, contact_data)
             return f"Contact updated successfully!\n\n{format_contact(contact)}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to update contact - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def update_contact_advanced(resource_name: str, contact_data: Dict[str, Any]) -> str:
         """Update an existing contact with full field support including multiple emails, phones, addresses, etc.
 
@@ -307,15 +348,16 @@ def register_contact_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            contact = service.update_contact(resource_name, contact_data)
+            contact = await asyncio.to_thread(service.update_contact, resource_name, contact_data)
             return f"Advanced contact updated successfully!\n\n{format_contact(contact)}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to update advanced contact - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def delete_contact(resource_name: str) -> str:
         """Delete a contact by resource name.
 
@@ -324,22 +366,125 @@ def register_contact_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            result = service.delete_contact(resource_name)
+            result = await asyncio.to_thread(service.delete_contact, resource_name)
             if result.get("success"):
                 return f"Contact {resource_name} deleted successfully."
             else:
                 return f"Failed to delete contact: {result.get('message', 'Unknown error')}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to delete contact - {str(e)}"
 
 
+def register_batch_contact_tools(mcp: FastMCP) -> None:
+    """Register bulk contact management tools with the MCP server."""
+
+    @mcp.tool()
+    @with_timeout
+    async def batch_create_contacts(contacts: List[Dict[str, Any]]) -> str:
+        """Create multiple contacts at once using batched API requests.
+
+        Args:
+            contacts: List of contact dictionaries, each in the create_contact_advanced format
+        """
+        service = init_service()
+        if not service:
+            return _ERR_NO_SERVICE
+
+        if not contacts:
+            return "Error: No contacts provided."
+
+        try:
+            created = await asyncio.to_thread(service.batch_create_contacts, contacts)
+            return f"Created {len(created)} contact(s) successfully!\n\n{format_contacts_list(created)}"
+        except GoogleContactsError as e:
+            return f"Error: Failed to create contacts - {str(e)}"
+
+    @mcp.tool()
+    @with_timeout
+    async def batch_delete_contacts(resource_names: List[str]) -> str:
+        """Delete multiple contacts at once using batched API requests.
+
+        Args:
+            resource_names: List of contact resource names (people/*) to delete
+        """
+        service = init_service()
+        if not service:
+            return _ERR_NO_SERVICE
+
+        if not resource_names:
+            return "Error: No contacts provided."
+
+        try:
+            result = await asyncio.to_thread(service.batch_delete_contacts, resource_names)
+            return f"Deleted {result['deleted_count']} contact(s) successfully."
+        except GoogleContactsError as e:
+            return f"Error: Failed to delete contacts - {str(e)}"
+
+    @mcp.tool()
+    @with_timeout
+    async def batch_get_contacts(identifiers: List[str], include_all_fields: bool = True) -> str:
+        """Get multiple contacts at once by resource name or email address.
+
+        Args:
+            identifiers: List of resource names (people/*) or email addresses
+            include_all_fields: Whether to include all contact fields
+        """
+        service = init_service()
+        if not service:
+            return _ERR_NO_SERVICE
+
+        if not identifiers:
+            return "Error: No contacts provided."
+
+        # Resource names share batched requests; emails are looked up concurrently
+        resource_names = [i for i in identifiers if i.startswith("people/")]
+        emails = [i for i in identifiers if not i.startswith("people/")]
+        results = await asyncio.gather(
+            asyncio.to_thread(service.get_contacts_batch, resource_names, include_all_fields),
+            *(
+                asyncio.to_thread(service.get_contact, email, include_all_fields)
+                for email in emails
+            ),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            # Only service errors mean a contact could not be fetched; anything else is a bug
+            if isinstance(result, Exception) and not isinstance(result, GoogleContactsError):
+                raise result
+
+        if isinstance(results[0], GoogleContactsError):
+            return f"Error: Failed to get contacts - {str(results[0])}"
+
+        # Keep the caller's order; getBatchGet silently omits names it cannot resolve
+        by_resource_name = {contact.get("resourceName"): contact for contact in results[0]}
+        by_email = dict(zip(emails, results[1:]))
+        contacts = []
+        not_found = []
+        for identifier in identifiers:
+            if identifier.startswith("people/"):
+                contact = by_resource_name.get(identifier)
+            else:
+                contact = by_email[identifier]
+            if contact is None or isinstance(contact, GoogleContactsError):
+                not_found.append(identifier)
+            else:
+                contacts.append(contact)
+
+        formatted = format_contacts_list(contacts)
+        if not_found:
+            formatted += "\n\nCould not retrieve: " + ", ".join(not_found)
+        return formatted
+
+
 def register_directory_tools(mcp: FastMCP) -> None:
     """Register directory and workspace tools with the MCP server."""
 
     @mcp.tool()
+    @with_timeout
     async def list_workspace_users(query: Optional[str] = None, max_results: int = 50) -> str:
         """List Google Workspace users in your organization's directory.
 
@@ -352,15 +497,18 @@ def register_directory_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            workspace_users = service.list_directory_people(query=query, max_results=max_results)
+            workspace_users = await asyncio.to_thread(
+                service.list_directory_people, query=query, max_results=max_results
+            )
             return format_directory_people(workspace_users, query)
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to list Google Workspace users - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def search_directory(query: str, max_results: int = 20) -> str:
         """Search for people specifically in the Google Workspace directory.
 
@@ -372,15 +520,16 @@ def register_directory_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            results = service.search_directory(query, max_results)
+            results = await asyncio.to_thread(service.search_directory, query, max_results)
             return format_directory_people(results, query)
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to search directory - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def get_other_contacts(max_results: int = 50) -> str:
         """Retrieve contacts from the 'Other contacts' section.
 
@@ -392,10 +541,10 @@ def register_directory_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            other_contacts = service.get_other_contacts(max_results)
+            other_contacts = await asyncio.to_thread(service.get_other_contacts, max_results)
 
             if not other_contacts:
                 return "No 'Other contacts' found in your Google account."
@@ -406,7 +555,7 @@ def register_directory_tools(mcp: FastMCP) -> None:
             # Format and return the results
             formatted_list = format_contacts_list(other_contacts)
             return f"Other Contacts (people you've interacted with but haven't added):\n\n{formatted_list}\n\n{with_email} of these contacts have email addresses."
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to retrieve other contacts - {str(e)}"
 
 
@@ -414,6 +563,7 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
     """Register contact group management tools with the MCP server."""
 
     @mcp.tool()
+    @with_timeout
     async def list_contact_groups(include_system_groups: bool = True) -> str:
         """List all contact groups (labels) in your Google Contacts.
 
@@ -425,15 +575,16 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            groups = service.list_contact_groups(include_system_groups)
+            groups = await asyncio.to_thread(service.list_contact_groups, include_system_groups)
             return format_contact_groups_list(groups)
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to list contact groups - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def create_contact_group(name: str, client_data: List[Dict[str, str]] = None) -> str:
         """Create a new contact group (label) to organize your contacts.
 
@@ -443,15 +594,16 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            group = service.create_contact_group(name, client_data)
+            group = await asyncio.to_thread(service.create_contact_group, name, client_data)
             return f"Contact group created successfully!\n\n{format_contact_group(group)}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to create contact group - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def get_contact_group(
         resource_name: str, include_members: bool = False, max_members: int = 50
     ) -> str:
@@ -464,16 +616,19 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
             max_members_param = max_members if include_members else 0
-            group = service.get_contact_group(resource_name, max_members_param)
+            group = await asyncio.to_thread(
+                service.get_contact_group, resource_name, max_members_param
+            )
             return format_contact_group(group)
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to get contact group - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def update_contact_group(
         resource_name: str, name: str, client_data: List[Dict[str, str]] = None
     ) -> str:
@@ -486,15 +641,18 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            group = service.update_contact_group(resource_name, name, client_data)
+            group = await asyncio.to_thread(
+                service.update_contact_group, resource_name, name, client_data
+            )
             return f"Contact group updated successfully!\n\n{format_contact_group(group)}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to update contact group - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def delete_contact_group(resource_name: str) -> str:
         """Delete a contact group. Note: This only works for user-created groups, not system groups.
 
@@ -503,18 +661,19 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            result = service.delete_contact_group(resource_name)
+            result = await asyncio.to_thread(service.delete_contact_group, resource_name)
             if result.get("success"):
                 return f"Contact group {resource_name} deleted successfully."
             else:
                 return f"Failed to delete contact group: {result.get('message', 'Unknown error')}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to delete contact group - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def add_contacts_to_group(
         group_resource_name: str, contact_resource_names: List[str]
     ) -> str:
@@ -526,15 +685,18 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            result = service.add_contacts_to_group(group_resource_name, contact_resource_names)
+            result = await asyncio.to_thread(
+                service.add_contacts_to_group, group_resource_name, contact_resource_names
+            )
             return format_group_membership_result(result, "add")
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to add contacts to group - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def remove_contacts_from_group(
         group_resource_name: str, contact_resource_names: List[str]
     ) -> str:
@@ -546,15 +708,18 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
-            result = service.remove_contacts_from_group(group_resource_name, contact_resource_names)
+            result = await asyncio.to_thread(
+                service.remove_contacts_from_group, group_resource_name, contact_resource_names
+            )
             return format_group_membership_result(result, "remove")
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to remove contacts from group - {str(e)}"
 
     @mcp.tool()
+    @with_timeout
     async def search_contacts_by_group(group_resource_name: str, max_results: int = 50) -> str:
         """Find all contacts that belong to a specific contact group.
 
@@ -566,24 +731,21 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
         """
         service = init_service()
         if not service:
-            return "Error: Google Contacts service is not available. Please check your credentials."
+            return _ERR_NO_SERVICE
 
         try:
             # Get the group with member resource names
-            group = service.get_contact_group(group_resource_name, max_results)
+            group = await asyncio.to_thread(
+                service.get_contact_group, group_resource_name, max_results
+            )
 
             if not group.get("memberResourceNames"):
                 return f"No contacts found in group '{group.get('name', 'Unknown Group')}'"
 
-            # Get full contact details for each member
-            member_contacts = []
-            for member_resource_name in group["memberResourceNames"]:
-                try:
-                    contact = service.get_contact(member_resource_name, include_all_fields=False)
-                    member_contacts.append(contact)
-                except Exception:
-                    # Skip contacts that can't be retrieved
-                    continue
+            # Get full contact details for all members in batched requests
+            member_contacts = await asyncio.to_thread(
+                service.get_contacts_batch, group["memberResourceNames"]
+            )
 
             if not member_contacts:
                 return (
@@ -592,5 +754,5 @@ def register_contact_group_tools(mcp: FastMCP) -> None:
 
             group_name = group.get("name", "Unknown Group")
             return f"Contacts in group '{group_name}':\n\n{format_contacts_list(member_contacts)}"
-        except Exception as e:
+        except GoogleContactsError as e:
             return f"Error: Failed to search contacts by group - {str(e)}"